@@ -0,0 +1,128 @@
+import collections
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import shapely
+from shapely.geometry import shape
+
+ADMIN_LEVELS = ['sido', 'sigungu', 'eupmyeondong']
+
+# 경계 파일 속성 이름 후보 (행정동 GeoJSON / 통계지리정보 경계 파일)
+PROPERTY_NAMES = {
+    'sido': ['sidonm', 'SIDO_NM', 'CTP_KOR_NM'],
+    'sigungu': ['sggnm', 'SIGUNGU_NM', 'SIG_KOR_NM'],
+    'eupmyeondong': ['adm_nm', 'ADM_NM', 'EMD_KOR_NM']
+}
+
+# 좌표 캐시 키 정밀도 (소수 6자리 = 약 0.1m)
+COORD_DECIMALS = 6
+
+# 경계 도형 STRtree와 경계별 행정구역 이름
+BoundaryIndex = collections.namedtuple('BoundaryIndex', ['tree', 'attributes', 'key'])
+
+
+## 1. 경계 파일 읽기
+def feature_attributes(properties):
+    values = {}
+    for level, names in PROPERTY_NAMES.items():
+        value = next((properties[name] for name in names if properties.get(name)), None)
+        values[level] = value
+    # 행정동 GeoJSON의 adm_nm은 '서울특별시 종로구 사직동' 형태 -> 마지막 단어만
+    if values['eupmyeondong']:
+        values['eupmyeondong'] = values['eupmyeondong'].split()[-1]
+    return values
+
+
+def read_boundaries(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    geometries, rows = [], []
+    for feature in data.get('features', []):
+        if not feature.get('geometry'):
+            continue
+        geometries.append(shape(feature['geometry']))
+        rows.append(feature_attributes(feature.get('properties') or {}))
+    return np.array(geometries, dtype=object), pd.DataFrame(rows, columns=ADMIN_LEVELS)
+
+
+# 경계 파일이 바뀌면 좌표 캐시도 새로 만듦
+def boundary_key(path):
+    stat = os.stat(path)
+    return hashlib.sha1(f'{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}'.encode('utf-8')).hexdigest()[:16]
+
+
+def load_index(path):
+    geometries, attributes = read_boundaries(path)
+    return BoundaryIndex(shapely.STRtree(geometries), attributes, boundary_key(path))
+
+
+## 2. 좌표 -> 행정구역 (모든 점을 한 번의 STRtree 질의로)
+def locate(index, lat, lon):
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    result = pd.DataFrame(index=range(len(lat)), columns=ADMIN_LEVELS, dtype=object)
+    valid = np.flatnonzero(~np.isnan(lat) & ~np.isnan(lon))
+    if len(valid) == 0:
+        return result
+
+    point_idx, boundary_idx = index.tree.query(shapely.points(lon[valid], lat[valid]), predicate='intersects')
+    # 경계선 위의 점은 첫 번째 경계로
+    point_idx, first = np.unique(point_idx, return_index=True)
+    matched = index.attributes.iloc[boundary_idx[first]]
+    result.iloc[valid[point_idx]] = matched.to_numpy()
+    return result
+
+
+## 3. 좌표별 캐시를 거쳐 행정구역 부여
+def admin_cache_path(cache_dir, index):
+    return os.path.join(cache_dir, f'admin_{index.key}.pkl')
+
+
+def load_admin_cache(path):
+    if path and os.path.exists(path):
+        return pd.read_pickle(path)
+    return pd.DataFrame(columns=['lat_key', 'lon_key'] + ADMIN_LEVELS)
+
+
+def admin_regions(df, index, cache_dir=None):
+    keys = pd.DataFrame({
+        'lat_key': pd.to_numeric(df['latitude'], errors='coerce').round(COORD_DECIMALS),
+        'lon_key': pd.to_numeric(df['longitude'], errors='coerce').round(COORD_DECIMALS)
+    }, index=df.index)
+    unique = keys.dropna().drop_duplicates()
+
+    path = admin_cache_path(cache_dir, index) if cache_dir else None
+    cache = load_admin_cache(path)
+    missing = unique.merge(cache[['lat_key', 'lon_key']], how='left', indicator=True)
+    missing = missing[missing['_merge'] == 'left_only'][['lat_key', 'lon_key']].reset_index(drop=True)
+
+    if len(missing):
+        located = locate(index, missing['lat_key'], missing['lon_key'])
+        cache = pd.concat([cache, pd.concat([missing, located], axis=1)], ignore_index=True)
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            cache.to_pickle(path)
+
+    admin = keys.merge(cache, on=['lat_key', 'lon_key'], how='left')
+    admin.index = df.index
+    return admin[ADMIN_LEVELS]
+
+
+## 4. 텍스트 기반 구 정보와 비교
+def compare_districts(df, admin):
+    table = pd.DataFrame({
+        'region': df['region'],
+        'text': df['district'] if 'district' in df.columns else None,
+        'spatial': admin['sigungu']
+    })
+    table['status'] = np.select(
+        [table['spatial'].isna(),
+         table['text'].isna(),
+         table['text'] == table['spatial']],
+        ['경계 밖', '텍스트 추출 실패', '일치'],
+        default='불일치'
+    )
+    return table.groupby(['region', 'status']).size().unstack(fill_value=0)
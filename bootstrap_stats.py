@@ -0,0 +1,172 @@
+import os
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from pipeline import fingerprint
+
+SCORE_COLUMNS = ['accessibility_score', 'safety_score']
+
+# 한 번에 만드는 재표본 배열 크기 상한
+MAX_BATCH_CELLS = 5_000_000
+
+# 값 종류가 이 이하이면 다항분포 재표본 사용
+MAX_DISCRETE_VALUES = 64
+
+# 화장실 수가 이보다 적은 구는 부트스트랩 구간이 거의 0폭이므로
+# 축소 평균 기준 구간(공통 분산 사용)으로 대체
+MIN_BOOTSTRAP_COUNT = 5
+
+# 순위에 포함할 구의 기본 최소 화장실 수
+MIN_RANK_COUNT = 3
+
+# 구 정보가 없는 화장실의 그룹 이름 (구간은 계산하되 순위에서는 제외)
+UNKNOWN_GROUP = '미상'
+
+
+# 그룹별로 정렬된 값 배열(행 x 컬럼)과 그룹 경계
+def grouped_arrays(df, by, columns):
+    keys = df[by].astype(object).where(df[by].notna(), UNKNOWN_GROUP)
+    codes, uniques = pd.factorize(pd.MultiIndex.from_frame(keys))
+    order = np.argsort(codes, kind='stable')
+    sizes = np.bincount(codes, minlength=len(uniques))
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    groups = uniques.to_frame(index=False)
+    groups.columns = by
+    return groups, df[columns].to_numpy(dtype=float)[order], sizes, offsets
+
+
+## 1. 부트스트랩 평균 (모든 구, 모든 점수 컬럼을 한 번에, 재표본은 묶음 단위) -> (재표본 x 구 x 컬럼)
+def bootstrap_means(values, sizes, offsets, n_boot=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    means = np.empty((n_boot, len(sizes), values.shape[1]))
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        uniques, inverse = np.unique(column, return_inverse=True)
+        if len(uniques) <= MAX_DISCRETE_VALUES:
+            means[:, :, j] = bootstrap_discrete(uniques, inverse, sizes, n_boot, rng)
+        else:
+            means[:, :, j] = bootstrap_gather(column, sizes, offsets, n_boot, rng)
+    return means
+
+
+# 값 종류가 적은 점수(0, 1, 2 ...): 구별 값 빈도에서 다항분포로 재표본 -> 행 수와 무관하게 (재표본 x 구 x 값 종류)
+def bootstrap_discrete(uniques, inverse, sizes, n_boot, rng):
+    n_groups, n_values = len(sizes), len(uniques)
+    owner = np.repeat(np.arange(n_groups), sizes)
+    counts = np.bincount(owner * n_values + inverse, minlength=n_groups * n_values).reshape(n_groups, n_values)
+    pvals = counts / sizes[:, None]
+
+    batch = max(1, MAX_BATCH_CELLS // max(n_groups * n_values, 1))
+    means = np.empty((n_boot, n_groups))
+    for start in range(0, n_boot, batch):
+        b = min(batch, n_boot - start)
+        draws = rng.multinomial(sizes, pvals, size=(b, n_groups))
+        means[start:start + b] = draws @ uniques / sizes
+    return means
+
+
+# 연속값: 행마다 같은 구 안에서 무작위 위치를 뽑고 reduceat으로 구별 합계를 구함
+def bootstrap_gather(column, sizes, offsets, n_boot, rng):
+    n = len(column)
+    row_size = np.repeat(sizes, sizes)
+    row_offset = np.repeat(offsets, sizes)
+
+    batch = max(1, MAX_BATCH_CELLS // max(n, 1))
+    means = np.empty((n_boot, len(sizes)))
+    for start in range(0, n_boot, batch):
+        b = min(batch, n_boot - start)
+        idx = row_offset + (rng.random((b, n), dtype=np.float32) * row_size).astype(np.int64)
+        idx = np.minimum(idx, row_offset + row_size - 1)  # float32 반올림 보정
+        means[start:start + b] = np.add.reduceat(column[idx], offsets, axis=1) / sizes
+    return means
+
+
+## 2. 경험적 베이즈 축소 평균 (정규-정규 모형, 적률법)
+# 표본이 적은 구일수록 상위 평균(지역 평균)쪽으로 당겨짐
+def shrunk_means(group_means, group_vars, sizes, prior_means):
+    multi = sizes > 1
+    pooled_var = np.average(group_vars[multi], weights=sizes[multi] - 1) if multi.any() else 0.0
+    sampling_var = pooled_var / sizes
+    tau2 = max(np.var(group_means - prior_means) - sampling_var.mean(), 1e-6)
+    weight = tau2 / (tau2 + sampling_var)
+    return weight * group_means + (1 - weight) * prior_means, weight, sampling_var
+
+
+def district_confidence(df, columns, by=('region', 'district'), n_boot=2000, ci=0.95, seed=0):
+    by = list(by)
+    groups, values, sizes, offsets = grouped_arrays(df, by, columns)
+    boots = bootstrap_means(values, sizes, offsets, n_boot=n_boot, seed=seed)
+
+    sums = np.add.reduceat(values, offsets, axis=0)
+    sq_sums = np.add.reduceat(values ** 2, offsets, axis=0)
+    means = sums / sizes[:, None]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variances = np.where(sizes[:, None] > 1, (sq_sums - sizes[:, None] * means ** 2) / (sizes[:, None] - 1), 0.0)
+
+    # 상위 평균: 구가 여러 단계면 첫 단계(지역) 평균, 아니면 전체 평균
+    if len(by) > 1:
+        top = groups[by[0]].to_numpy()
+        prior = (pd.DataFrame(sums).groupby(top).transform('sum').to_numpy() /
+                 pd.Series(sizes).groupby(top).transform('sum').to_numpy()[:, None])
+    else:
+        prior = np.broadcast_to(values.mean(axis=0), means.shape)
+
+    alpha = (1 - ci) / 2
+    ci_low = np.quantile(boots, alpha, axis=0)
+    ci_high = np.quantile(boots, 1 - alpha, axis=0)
+    se = boots.std(axis=0, ddof=1)
+
+    # 표본이 적은 구: 축소 평균 ± z * 공통 분산 기준 표준오차 (sqrt(공통 분산 / n))
+    small = sizes < MIN_BOOTSTRAP_COUNT
+    z = NormalDist().inv_cdf(1 - alpha)
+
+    frames = []
+    for j, column in enumerate(columns):
+        shrunk, weight, sampling_var = shrunk_means(means[:, j], variances[:, j], sizes, prior[:, j])
+        pooled_se = np.sqrt(sampling_var)
+        result = groups.copy()
+        result['score'] = column
+        result['n'] = sizes
+        result['mean'] = means[:, j]
+        result['ci_low'] = np.where(small, shrunk - z * pooled_se, ci_low[:, j])
+        result['ci_high'] = np.where(small, shrunk + z * pooled_se, ci_high[:, j])
+        result['se'] = np.where(small, pooled_se, se[:, j])
+        result['interval'] = np.where(small, 'shrunk', 'bootstrap')
+        result['shrunk_mean'] = shrunk
+        result['shrink_weight'] = weight
+        frames.append(result)
+    return pd.concat(frames, ignore_index=True)
+
+
+## 3. 모든 점수 컬럼 (지문 기준 캐시)
+def district_statistics(df, columns=SCORE_COLUMNS, by=('region', 'district'), n_boot=2000, ci=0.95, seed=0,
+                        cache_dir=None):
+    by = list(by)
+    path = None
+    if cache_dir:
+        key = fingerprint(df, by, columns, n_boot=n_boot, ci=ci, seed=seed, min_bootstrap=MIN_BOOTSTRAP_COUNT)
+        path = os.path.join(cache_dir, f'bootstrap_{key}.pkl')
+        if os.path.exists(path):
+            return pd.read_pickle(path)
+
+    result = district_confidence(df, list(columns), by, n_boot=n_boot, ci=ci, seed=seed)
+    numeric = ['mean', 'ci_low', 'ci_high', 'se', 'shrunk_mean', 'shrink_weight']
+    result[numeric] = result[numeric].round(3)
+
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        result.to_pickle(path)
+    return result
+
+
+## 4. 표본 크기를 반영한 순위 (신뢰구간 하한 기준, 작은 구는 축소 평균 구간의 하한)
+# 구 정보가 없는 그룹은 실제 구가 아니므로 제외
+def confident_ranking(stats, score='safety_score', min_count=MIN_RANK_COUNT, by=('region', 'district')):
+    known = (stats[list(by)] != UNKNOWN_GROUP).all(axis=1)
+    table = stats[(stats['score'] == score) & (stats['n'] >= min_count) & known].copy()
+    table['rank_by_mean'] = table['mean'].rank(ascending=False, method='min').astype(int)
+    table['rank_by_shrunk'] = table['shrunk_mean'].rank(ascending=False, method='min').astype(int)
+    table['rank_by_lower'] = table['ci_low'].rank(ascending=False, method='min').astype(int)
+    return table.sort_values('rank_by_lower').reset_index(drop=True)
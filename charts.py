@@ -0,0 +1,82 @@
+import os
+
+import matplotlib
+matplotlib.use('Agg')  # 화면 없이 파일로 저장
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+# 한글 폰트 설정
+plt.rcParams['font.family'] = 'Malgun Gothic'
+plt.rcParams['axes.unicode_minus'] = False
+
+# 색상 지정
+region_colors = {
+    '서울': '#87CEEB',
+    '부산': '#00CED1',
+    '제주도': '#4682B4'
+}
+
+
+# 지역별 접근성 점수 비교 시각화
+def plot_region_accessibility(region_summary, path):
+    data = region_summary.reset_index()
+    plt.figure(figsize=(8, 5))
+    sns.barplot(
+        x='region',
+        y='accessibility_score',
+        hue='region',
+        data=data,
+        palette=region_colors,
+        legend=False
+    )
+    plt.title('지역별 접근성 점수 비교', fontsize=16, pad=20)
+    plt.xlabel('<지역>')
+    plt.ylabel('<접근성 점수>')
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+
+
+# 지역별 위험 화장실 비율 시각화
+def plot_risk_ratio(risk_ratio, path):
+    risk_ratio_sorted = risk_ratio.sort_values(ascending=False)
+    plt.figure(figsize=(8, 5))
+    plt.bar(risk_ratio_sorted.index, risk_ratio_sorted.values, color=['#8B0000', '#CD5C5C', '#FA8072'][:len(risk_ratio_sorted)])
+    plt.title('지역별 위험 화장실 비율', fontsize=16, pad=20)
+    plt.ylabel('<위험 비율>')
+    plt.xlabel('<지역>')
+    plt.ylim(0, 1)
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+
+
+# 지역별 최우선 개선 대상 지점 수 시각화
+def plot_critical_counts(critical_points, path):
+    region_counts = critical_points['region'].value_counts()
+    plt.figure(figsize=(8, 5))
+    bars = plt.bar(region_counts.index, region_counts.values, color=['#8B0000', '#CD5C5C', '#FA8072'][:len(region_counts)])
+    plt.title('지역별 최우선 개선 대상 지점 수', fontsize=16, pad=20)
+    plt.xlabel('<지역>')
+    plt.ylabel('<지점 수>')
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2, height + 2, f'{int(height)}',
+                 ha='center', va='bottom', fontsize=11)
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+
+
+def save_charts(summaries, out_dir='.'):
+    charts = [
+        ('region_accessibility.png', plot_region_accessibility, summaries['region_summary']),
+        ('risk_ratio.png', plot_risk_ratio, summaries['risk_ratio']),
+        ('critical_counts.png', plot_critical_counts, summaries['critical_points'])
+    ]
+    saved = []
+    for file_name, plot, data in charts:
+        path = os.path.join(out_dir, file_name)
+        plot(data, path)
+        saved.append(path)
+    return saved
@@ -0,0 +1,111 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from facility_stats import normalize_flag
+
+# 지표 구성 요소 (컬럼명: 이름)
+COMPONENTS = {
+    'disabled_toilet': '장애인화장실',
+    'diaper_table': '기저귀교환대',
+    'emergency_bell': '비상벨',
+    'cctv': 'CCTV',
+    'safety_facility': '안전관리시설'
+}
+
+FLAG_SOURCES = {
+    'diaper_table': 'has_diaper_table',
+    'emergency_bell': 'emergency_bell_installed',
+    'cctv': 'has_cctv',
+    'safety_facility': 'safety_facility_required'
+}
+
+# 기본 가중치 방식 (구성 요소 순서대로, 합이 1이 되도록 정규화해서 사용)
+DEFAULT_SCHEMES = {
+    '균등': [1, 1, 1, 1, 1],
+    '접근성 중심': [2, 2, 0.5, 0.5, 0.5],
+    '안전성 중심': [0.5, 0.5, 2, 2, 2],
+    '장애인 편의': [3, 1, 1, 0.5, 0.5],
+    '여성·아동 안전': [0.5, 2, 2, 1.5, 1]
+}
+
+METHODS = ['capped', 'percentile', 'zscore']
+
+
+## 1. 구성 요소 (0 ~ 1, 장애인화장실 수는 cap개에서 자름)
+def components(df, cap=2):
+    disabled = (
+        pd.to_numeric(df['male_disabled_toilet_count'], errors='coerce').fillna(0) +
+        pd.to_numeric(df['female_disabled_toilet_count'], errors='coerce').fillna(0)
+    )
+    comp = pd.DataFrame(index=df.index)
+    comp['disabled_toilet'] = disabled.clip(0, cap) / cap
+    for name, col in FLAG_SOURCES.items():
+        comp[name] = (normalize_flag(df[col]) == 1).astype(float)
+    return comp[list(COMPONENTS)]
+
+
+## 2. 지역 내 정규화 (그룹 단위 벡터 연산)
+def normalize(comp, keys, method='capped'):
+    if method == 'capped':
+        return comp
+    grouped = comp.groupby(keys)
+    if method == 'percentile':
+        # 동점은 평균 순위, 0 ~ 1
+        return grouped.rank(method='average', pct=True)
+    if method == 'zscore':
+        mean = grouped.transform('mean')
+        std = grouped.transform('std', ddof=0).replace(0, np.nan)
+        return ((comp - mean) / std).fillna(0)
+    raise ValueError(f"알 수 없는 정규화 방식: {method} (가능: {', '.join(METHODS)})")
+
+
+def weight_matrix(schemes):
+    names = list(schemes)
+    weights = np.array([schemes[name] for name in names], dtype=float)
+    if weights.shape[1] != len(COMPONENTS):
+        raise ValueError(f"가중치는 구성 요소 {len(COMPONENTS)}개({', '.join(COMPONENTS)})에 맞춰야 합니다")
+    weights = weights / weights.sum(axis=1, keepdims=True)
+    return names, weights
+
+
+## 3. 여러 가중치 방식을 한 번의 행렬곱으로 계산 (행 x 방식)
+def composite_scores(df, schemes=None, method='capped', cap=2, by='region'):
+    schemes = schemes or DEFAULT_SCHEMES
+    keys = df[by].astype(object).where(df[by].notna(), '미상')
+    comp = normalize(components(df, cap), keys, method)
+    names, weights = weight_matrix(schemes)
+    return pd.DataFrame(comp.to_numpy() @ weights.T, index=df.index, columns=names)
+
+
+## 4. 구별 지표 및 순위 (방식별 열 전체를 한 번에 집계)
+# 구 정보가 없는 화장실은 실제 구가 아니므로 순위에서 제외
+def district_rankings(df, scores, by=('region', 'district'), min_count=1):
+    by = list(by)
+    known = df[by].notna().all(axis=1)
+    keys = df.loc[known, by]
+    grouped = scores[known].groupby([keys[col] for col in by])
+    means = grouped.mean().round(3)
+    means.insert(0, 'n', grouped.size())
+    means = means[means['n'] >= min_count]
+
+    # 지역 안에서의 순위 (1 = 가장 높음), 지역 단위 집계면 전체 순위
+    values = means[scores.columns]
+    ranked = values.groupby(level=0) if len(by) > 1 else values
+    ranks = ranked.rank(ascending=False, method='min').astype(int)
+    result = means.join(ranks, rsuffix='_rank')
+    return result.reset_index()
+
+
+## 5. 방식 간 순위 비교 (Spearman 상관)
+def ranking_comparison(rankings, schemes):
+    names = list(schemes)
+    return rankings[[f'{name}_rank' for name in names]].set_axis(names, axis=1).corr(method='spearman').round(3)
+
+
+def load_schemes(path):
+    with open(path, encoding='utf-8') as f:
+        schemes = json.load(f)
+    weight_matrix(schemes)  # 형식 확인
+    return schemes
@@ -0,0 +1,224 @@
+import functools
+import re
+
+import numpy as np
+import pandas as pd
+
+# 기본 분석 대상 시설 컬럼 (컬럼명: 시설명)
+FACILITY_COLUMNS = {
+    'has_diaper_table': '기저귀교환대',
+    'has_cctv': 'CCTV',
+    'emergency_bell_installed': '비상벨',
+    'safety_facility_required': '안전관리시설'
+}
+
+# 설치 / 미설치로 인정하는 값 (공백 제거, 대문자 기준)
+YES_VALUES = {'Y', 'YES', '1', '1.0', 'TRUE', 'O', '유', '있음', '설치'}
+NO_VALUES = {'N', 'NO', '0', '0.0', 'FALSE', 'X', '무', '없음', '미설치'}
+
+# 설치 장소 공간별 비트 (남자 / 여자 / 장애인 / 공용), 해석할 수 없는 장소는 기타 비트
+SPACES = {'male': '남자화장실', 'female': '여자화장실', 'disabled': '장애인화장실', 'common': '공용'}
+SPACE_BITS = {space: 1 << i for i, space in enumerate(SPACES)}
+OTHER_BIT = 1 << len(SPACES)
+
+# 장소 구분자 ('+', ',', '/', '및' 등), 공용 공간 단어, 공간 정보가 없는 단어
+LOCATION_SEPARATORS = r'[+,/·、;&]|및'
+COMMON_KEYWORDS = ['공용', '입구', '출입구', '복도', '통로', '세면', '대기', '외부', '관리실']
+# 성별은 한 글자 포함이 아니라 단어 단위로 판정 ('여러 곳', '남문' 등이 걸리지 않도록)
+GENDER_WORDS = {
+    '남': ['male'], '남자': ['male'], '남성': ['male'],
+    '여': ['female'], '여자': ['female'], '여성': ['female'],
+    '남녀': ['male', 'female'], '남여': ['male', 'female']
+}
+# 단어 뒤에 붙는 화장실 표기 ('여자화장실', '남성용', '화장실내부' -> '여자', '남성', '')
+ROOM_SUFFIX = r'(용)?(화장실|칸)?(내부|내|안)?$'
+NEUTRAL_TOKENS = {'각', '각칸', '대변기', '대변칸'}
+# 설치 여부 정규화: 1(설치) / 0(미설치) / -1(알 수 없음)
+# 고유값마다 한 번만 판정한 뒤 코드 배열로 펼침
+def normalize_flag(series):
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    lookup = np.full(len(uniques) + 1, -1, dtype=np.int8)  # 마지막 칸은 NaN(-1 코드)용
+    for i, value in enumerate(uniques):
+        if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+            lookup[i] = 1 if value > 0 else 0
+            continue
+        text = str(value).strip().upper()
+        if text in YES_VALUES:
+            lookup[i] = 1
+        elif text in NO_VALUES:
+            lookup[i] = 0
+    return lookup[codes]
+
+
+# 점수 계산의 설치 판정: 'Y'만 설치 (0/1)
+def yes_flag(series):
+    return (series.astype(str).str.strip() == 'Y').astype(int)
+
+
+# 단어 하나 -> (공간 비트, 공간 정보가 없는 단어인지)
+def word_bits(word):
+    if '장애' in word:
+        return SPACE_BITS['disabled'], False
+    base = re.sub(ROOM_SUFFIX, '', word)
+    if not base or base in NEUTRAL_TOKENS:
+        return 0, True
+    return sum(SPACE_BITS[space] for space in GENDER_WORDS.get(base, [])), False
+
+
+# 설치 장소 문구 -> 공간 비트마스크 (같은 문구는 한 번만 해석)
+# 구분자로 나눈 항목마다 단어 단위로 판정: 성별/장애인 공간이 있으면 그 공간 ('남자화장실 입구' -> 남자),
+# 없으면 공용 단어, 그것도 없고 공간 정보가 없는 단어만 있으면 건너뜀
+@functools.lru_cache(maxsize=None)
+def parse_location(text):
+    mask = 0
+    for token in re.split(LOCATION_SEPARATORS, text):
+        words = token.split()
+        if not words:
+            continue
+        parsed = [word_bits(word) for word in words]
+        bits = 0
+        for word_mask, _ in parsed:
+            bits |= word_mask
+        if not bits and any(keyword in word for word in words for keyword in COMMON_KEYWORDS):
+            bits = SPACE_BITS['common']
+        if not bits and not all(neutral for _, neutral in parsed):
+            bits = OTHER_BIT
+        mask |= bits
+    return mask
+
+
+# 장소 컬럼 -> 행별 비트마스크 (값이 없으면 0)
+def encode_locations(series):
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    lookup = np.zeros(len(uniques) + 1, dtype=np.uint8)  # 마지막 칸은 NaN(-1 코드)용
+    for i, value in enumerate(uniques):
+        lookup[i] = parse_location(str(value))
+    return lookup[codes]
+
+
+# 비트마스크 -> 표준 장소 이름 (남자 -> 여자 -> 장애인 -> 공용 순서로 고정)
+def location_label(mask):
+    names = [name for space, name in SPACES.items() if mask & SPACE_BITS[space]]
+    if mask & OTHER_BIT:
+        names.append('기타')
+    return '+'.join(names) or '미기재'
+
+
+# 시설 컬럼들을 행마다 비트마스크 하나로 압축 (i번째 비트 = columns[i])
+# installed: 설치 비트, unknown: 값이 비었거나 해석할 수 없는 비트
+def encode_flags(df, columns):
+    if len(columns) > 64:
+        raise ValueError(f"시설 컬럼은 최대 64개까지 지원합니다: {len(columns)}개")
+    installed = np.zeros(len(df), dtype=np.uint64)
+    unknown = np.zeros(len(df), dtype=np.uint64)
+    for bit, col in enumerate(columns):
+        if col in df.columns:
+            flag = normalize_flag(df[col])
+        else:
+            flag = np.full(len(df), -1, dtype=np.int8)
+        installed |= (flag == 1).astype(np.uint64) << np.uint64(bit)
+        unknown |= (flag == -1).astype(np.uint64) << np.uint64(bit)
+    return installed, unknown
+
+
+# 그룹 코드 생성 (by가 없으면 전체 하나)
+def group_codes(df, by):
+    if not by:
+        return np.zeros(len(df), dtype=np.int64), pd.DataFrame({'scope': ['전체']})
+    keys = df[by].astype(object).where(df[by].notna(), '미상')
+    codes, uniques = pd.factorize(pd.MultiIndex.from_frame(keys))
+    groups = uniques.to_frame(index=False)
+    groups.columns = by
+    return codes.astype(np.int64), groups
+
+
+# (그룹, 비트마스크) 조합별 개수 -> 조합 수만큼만 비트를 펼쳐서 그룹별로 합산
+def count_bits(codes, masks, n_groups, n_bits):
+    combos = pd.DataFrame({'g': codes, 'm': masks}).value_counts(sort=False)
+    combo_groups = combos.index.get_level_values('g').to_numpy(dtype=np.int64)
+    combo_masks = combos.index.get_level_values('m').to_numpy(dtype=np.uint64)
+    weights = combos.to_numpy(dtype=np.int64)
+
+    bits = ((combo_masks[:, None] >> np.arange(n_bits, dtype=np.uint64)) & np.uint64(1)).astype(bool)
+    slots = (combo_groups[:, None] * n_bits + np.arange(n_bits))[bits]
+    return np.bincount(slots, weights=np.repeat(weights, bits.sum(axis=1)), minlength=n_groups * n_bits) \
+        .reshape(n_groups, n_bits).astype(np.int64)
+
+
+## 시설별 설치율 / 미설치율 (지역, 구 단위)
+def facility_coverage(df, columns=None, by=None):
+    columns = list(columns or FACILITY_COLUMNS)
+    by = [by] if isinstance(by, str) else list(by or [])
+
+    codes, groups = group_codes(df, by)
+    installed, unknown = encode_flags(df, columns)
+    n_groups, n_bits = len(groups), len(columns)
+
+    totals = np.bincount(codes, minlength=n_groups)
+    installed_counts = count_bits(codes, installed, n_groups, n_bits)
+    unknown_counts = count_bits(codes, unknown, n_groups, n_bits)
+
+    result = groups.loc[groups.index.repeat(n_bits)].reset_index(drop=True)
+    result['facility'] = np.tile([FACILITY_COLUMNS.get(c, c) for c in columns], n_groups)
+    result['total'] = np.repeat(totals, n_bits)
+    result['installed'] = installed_counts.ravel()
+    result['not_installed'] = result['total'] - result['installed']  # 원본 분석과 같이 값 누락도 미설치로 집계
+    result['unknown'] = unknown_counts.ravel()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result['installed_rate'] = (result['installed'] / result['total'] * 100).round(1)
+        result['missing_rate'] = (result['not_installed'] / result['total'] * 100).round(1)
+        result['unknown_rate'] = (result['unknown'] / result['total'] * 100).round(1)
+    return result
+
+
+## 설치 장소별 분포 (설치된 지점만)
+def location_breakdown(df, flag_col='emergency_bell_installed', location_col='emergency_bell_location', by=None):
+    by = [by] if isinstance(by, str) else list(by or [])
+    installed = df[normalize_flag(df[flag_col]) == 1]
+    # 표기만 다른 장소는 같은 항목으로 묶고, 해석할 수 없는 장소는 원문 그대로
+    masks = encode_locations(installed[location_col])
+    labels = np.array([location_label(m) for m in range(OTHER_BIT << 1)], dtype=object)
+    raw = installed[location_col].astype(str).str.strip()
+    location = pd.Series(labels[masks], index=installed.index).where(masks & OTHER_BIT == 0, raw)
+
+    if not by:
+        counts = location.value_counts()
+        result = counts.rename_axis('location').reset_index(name='count')
+        result['share'] = (result['count'] / result['count'].sum() * 100).round(1)
+        return result
+
+    keys = [installed[col].astype(object).where(installed[col].notna(), '미상') for col in by]
+    counts = location.groupby(keys + [location.rename('location')]).size()
+    result = counts.reset_index(name='count')
+    result['share'] = (result['count'] / result.groupby(by)['count'].transform('sum') * 100).round(1)
+    return result.sort_values(by + ['count'], ascending=[True] * len(by) + [False]).reset_index(drop=True)
+
+
+## 비상벨 공간별 설치 공백 (비상벨은 있지만 해당 공간에는 없는 시설)
+def bell_coverage(df, by=None, flag_col='emergency_bell_installed', location_col='emergency_bell_location'):
+    by = [by] if isinstance(by, str) else list(by or [])
+    codes, groups = group_codes(df, by)
+    n_groups = len(groups)
+    installed = normalize_flag(df[flag_col]) == 1
+    masks = encode_locations(df[location_col])
+
+    def count(selected):
+        return np.bincount(codes[selected], minlength=n_groups)
+
+    result = groups.copy()
+    result['total'] = count(np.ones(len(df), dtype=bool))
+    result['bell_installed'] = count(installed)
+    result['location_missing'] = count(installed & (masks == 0))
+    # 공간을 알 수 있는 장소만 공백 계산에 사용 (기타로만 해석된 장소는 other_location으로 따로)
+    located = installed & (masks & (OTHER_BIT - 1) != 0)
+    result['bell_located'] = count(located)
+    for space, bit in SPACE_BITS.items():
+        result[f'{space}_covered'] = count(installed & (masks & bit != 0))
+        result[f'{space}_gap'] = count(located & (masks & bit == 0))
+    result['other_location'] = count(installed & (masks == OTHER_BIT))
+    # 장소는 적혀 있는데 비상벨 설치 여부가 설치가 아닌 경우
+    result['location_without_bell'] = count(~installed & (masks != 0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for space in SPACES:
+            result[f'{space}_gap_rate'] = (result[f'{space}_gap'] / result['bell_located'] * 100).round(1)
+    return result
@@ -0,0 +1,214 @@
+import os
+import pickle
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from pipeline import KAKAO_API_KEY, classify_region_by_latlon, extract_gu
+
+# 주소당 보관하는 후보 수
+TOP_N = 5
+
+# 후보 캐시 컬럼 (반복되는 문자열은 category로 저장)
+CANDIDATE_COLUMNS = ['query', 'rank', 'latitude', 'longitude', 'address_type', 'sido', 'sigungu', 'address_name']
+CATEGORY_COLUMNS = ['address_type', 'sido', 'sigungu']
+
+# 주소 유형별 가산점 (도로명/지번 정확 일치 > 행정구역만 일치)
+ADDRESS_TYPE_BONUS = {'ROAD_ADDR': 1.0, 'REGION_ADDR': 0.8, 'ROAD': 0.3, 'REGION': 0.2}
+
+# 지역명 -> Kakao 시/도 이름 앞 두 글자
+REGION_SIDO = {'서울': '서울', '부산': '부산', '제주도': '제주'}
+
+# 점수 가중치
+SIDO_WEIGHT = 4.0
+SIGUNGU_WEIGHT = 2.0
+BBOX_WEIGHT = 1.0
+RANK_PENALTY = 0.1
+
+
+## 1. 후보 캐시
+def empty_candidates():
+    candidates = pd.DataFrame({col: pd.Series(dtype=object) for col in CANDIDATE_COLUMNS})
+    candidates['rank'] = candidates['rank'].astype(np.int8)
+    candidates[['latitude', 'longitude']] = candidates[['latitude', 'longitude']].astype(float)
+    return compact(candidates)
+
+
+def compact(candidates):
+    candidates = candidates.copy()
+    for col in CATEGORY_COLUMNS:
+        candidates[col] = candidates[col].astype('category')
+    candidates['rank'] = candidates['rank'].astype(np.int8)
+    return candidates.reset_index(drop=True)
+
+
+def load_candidate_cache(cache_path='geocode_candidates.pkl'):
+    if not os.path.exists(cache_path):
+        return empty_candidates()
+    return pd.read_pickle(cache_path)
+
+
+def save_candidate_cache(candidates, cache_path='geocode_candidates.pkl'):
+    pd.to_pickle(compact(candidates), cache_path)
+
+
+# 기존 address_cache.pkl (주소 -> [위도, 경도])를 후보 1개짜리로 변환 (메타데이터 없음)
+def legacy_candidates(cache_path='address_cache.pkl'):
+    try:
+        with open(cache_path, 'rb') as f:
+            address_cache = pickle.load(f)
+    except FileNotFoundError:
+        return empty_candidates()
+    rows = []
+    for address, coord in address_cache.items():
+        lat, lon = list(coord)[:2]
+        if lat is None or lon is None or pd.isna(lat) or pd.isna(lon):
+            continue
+        rows.append((address, 0, float(lat), float(lon), None, None, None, None))
+    return compact(pd.DataFrame(rows, columns=CANDIDATE_COLUMNS))
+
+
+## 2. Kakao API 조회 (상위 N개 후보 + 매칭 정보)
+def fetch_candidates(address, api_key=KAKAO_API_KEY, size=TOP_N):
+    import requests  # 실제 조회할 때만 필요
+
+    url = 'https://dapi.kakao.com/v2/local/search/address.json'
+    headers = {"Authorization": f"KakaoAK {api_key}"}
+    params = {"query": address, "size": size}
+
+    try:
+        response = requests.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        body = response.json()
+    except Exception:
+        return None  # 조회 실패는 캐시하지 않고 다음 실행 때 다시 시도
+    # 오류 응답(한도 초과, 잘못된 키 등)도 실패로 처리 -> 'documents'가 있는 응답만 캐시
+    if not isinstance(body, dict) or 'documents' not in body:
+        return None
+    documents = body['documents']
+
+    rows = []
+    for rank, doc in enumerate(documents[:size]):
+        region = doc.get('road_address') or doc.get('address') or {}
+        rows.append((
+            address, rank, float(doc['y']), float(doc['x']), doc.get('address_type'),
+            region.get('region_1depth_name'), region.get('region_2depth_name'), doc.get('address_name')
+        ))
+    if not rows:
+        # 결과 없음도 캐시 (좌표 없는 후보 1개)
+        rows.append((address, 0, np.nan, np.nan, None, None, None, None))
+    return rows
+
+
+def fetch_missing(addresses, candidates, api_key=KAKAO_API_KEY, size=TOP_N, refresh=()):
+    # refresh: 캐시에 있어도 다시 조회할 주소 (조회에 성공하면 기존 후보를 교체)
+    refresh = set(refresh)
+    known = set(candidates['query'].dropna()) - refresh
+    rows, replaced = [], set()
+    for address in addresses:
+        if address in known:
+            continue
+        fetched = fetch_candidates(address, api_key, size)
+        if fetched is not None:
+            rows.extend(fetched)
+            replaced.add(address)
+        time.sleep(0.1)  # 너무 빠른 요청 방지
+    if not rows:
+        return candidates
+    kept = candidates[~candidates['query'].isin(replaced)]
+    new = pd.DataFrame(rows, columns=CANDIDATE_COLUMNS)
+    return compact(pd.concat([kept.astype({col: object for col in CATEGORY_COLUMNS}), new], ignore_index=True))
+
+
+# 다시 조회할 주소: 메타데이터 없는 기존 캐시 좌표뿐인 주소
+# (Kakao에서 받은 후보는 다시 조회해도 같으므로 시/도 불일치도 재조회하지 않고 점수로만 선택)
+def stale_queries(candidates):
+    has_meta = candidates['sido'].notna().groupby(candidates['query']).any()
+    has_coord = candidates['latitude'].notna().groupby(candidates['query']).any()
+    return set(has_meta.index[~has_meta & has_coord])
+
+
+## 3. 주소에서 기대 시/도, 시/군/구 추출
+def expected_sigungu(address, region):
+    if not isinstance(address, str):
+        return None
+    if region == '제주도':
+        match = re.search(r'(제주시|서귀포시)', address)
+        return match.group(1) if match else None
+    return extract_gu(address)
+
+
+def expected_regions(df):
+    addresses = df[['full_address', 'region']].drop_duplicates('full_address').dropna(subset=['full_address'])
+    addresses['expected_sido'] = addresses['region'].map(REGION_SIDO)
+    addresses['expected_sigungu'] = [expected_sigungu(a, r) for a, r in zip(addresses['full_address'], addresses['region'])]
+    return addresses.rename(columns={'full_address': 'query', 'region': 'expected_region'})
+
+
+## 4. 후보 점수화 및 선택 (벡터 연산, API 재조회 없음)
+def score_candidates(candidates, expected):
+    scored = candidates.merge(expected, on='query', how='inner')
+    sido = scored['sido'].astype(object)
+    sigungu = scored['sigungu'].astype(object)
+
+    # 메타데이터가 없으면 (기존 캐시) 좌표 기준 지역으로 대체
+    coord_region = pd.Series(classify_region_by_latlon(scored['latitude'], scored['longitude']), index=scored.index)
+    sido_match = np.where(
+        sido.notna(),
+        sido.fillna('').str[:2] == scored['expected_sido'],
+        coord_region.map(REGION_SIDO) == scored['expected_sido']
+    )
+    sigungu_match = sigungu.notna() & scored['expected_sigungu'].notna() & (sigungu == scored['expected_sigungu'])
+    bbox_match = coord_region == scored['expected_region']
+
+    scored['sido_match'] = sido_match
+    scored['sigungu_match'] = sigungu_match.to_numpy()
+    scored['bbox_match'] = bbox_match.to_numpy()
+    scored['geocode_score'] = (
+        SIDO_WEIGHT * sido_match +
+        SIGUNGU_WEIGHT * sigungu_match.to_numpy() +
+        BBOX_WEIGHT * bbox_match.to_numpy() +
+        scored['address_type'].astype(object).map(ADDRESS_TYPE_BONUS).fillna(0).to_numpy() -
+        RANK_PENALTY * scored['rank'].to_numpy()
+    )
+    scored.loc[scored['latitude'].isna(), 'geocode_score'] = -np.inf
+    return scored
+
+
+def resolve(candidates, expected):
+    scored = score_candidates(candidates, expected)
+    best = scored.sort_values(['query', 'geocode_score'], ascending=[True, False]).drop_duplicates('query')
+    best['geocode_match'] = np.select(
+        [best['latitude'].isna(),
+         ~best['sido_match'],
+         best['sigungu'].isna() & best['expected_sigungu'].notna(),
+         ~best['sigungu_match'] & best['expected_sigungu'].notna()],
+        ['없음', '시도 불일치', '시군구 미확인', '시군구 불일치'],
+        default='일치'
+    )
+    n_candidates = scored.groupby('query').size()
+    best['n_candidates'] = best['query'].map(n_candidates)
+    return best.set_index('query')
+
+
+## 5. 전체 좌표 변환
+def geocode(df, cache_path='geocode_candidates.pkl', legacy_cache_path='address_cache.pkl',
+            api_key=KAKAO_API_KEY, offline=False):
+    candidates = load_candidate_cache(cache_path)
+    if candidates.empty:
+        candidates = legacy_candidates(legacy_cache_path)
+
+    expected = expected_regions(df)
+    if not offline:
+        refresh = stale_queries(candidates)
+        candidates = fetch_missing(expected['query'], candidates, api_key, refresh=refresh)
+        save_candidate_cache(candidates, cache_path)
+
+    best = resolve(candidates, expected)
+    df = df.copy()
+    for col in ['latitude', 'longitude', 'geocode_score', 'geocode_match', 'n_candidates']:
+        df[col] = df['full_address'].map(best[col])
+    df['geocode_match'] = df['geocode_match'].fillna('없음')
+    return df
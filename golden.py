@@ -0,0 +1,165 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import geocoder
+import maps
+import pipeline
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+
+# 고정 테스트 데이터 (원본과 같은 컬럼의 CSV) 및 지오코딩 후보 캐시
+FIXTURE_DIR = os.path.join(BASE_DIR, 'fixture')
+FIXTURE_FILES = {region: os.path.splitext(name)[0] + '.csv' for region, name in pipeline.SOURCE_FILES.items()}
+FIXTURE_CANDIDATES = 'geocode_candidates.csv'
+
+# 기준 결과 (Parquet, 표 하나당 파일 하나)
+EXPECTED_DIR = os.path.join(BASE_DIR, 'expected')
+
+# 숫자 비교 허용 오차
+RTOL = 1e-9
+ATOL = 1e-9
+
+# 차이 예시로 보여줄 행 수
+MAX_EXAMPLES = 3
+
+
+## 1. 고정 데이터로 파이프라인 실행 (네트워크 없음)
+def fixture_candidates():
+    candidates = pd.read_csv(os.path.join(FIXTURE_DIR, FIXTURE_CANDIDATES), encoding='utf-8-sig')
+    return geocoder.compact(candidates[geocoder.CANDIDATE_COLUMNS])
+
+
+def marker_table(df_clean):
+    points = maps.point_table(df_clean)
+    variants = maps.map_variants(points, by_region=True, by_risk_type=True)
+    frames = []
+    for name, (positions, marker, strategy) in variants.items():
+        frame = points.iloc[positions].copy()
+        frame.insert(0, 'variant', name)
+        frame.insert(1, 'marker', marker)
+        frame.insert(2, 'strategy', strategy)
+        frames.append(frame)
+    return pd.concat(frames)
+
+
+def run_fixture(workdir):
+    df = pipeline.load_raw(FIXTURE_DIR, FIXTURE_FILES)
+
+    # 지오코더는 고정 후보 캐시만 사용
+    cache_path = os.path.join(workdir, 'geocode_candidates.pkl')
+    geocoder.save_candidate_cache(fixture_candidates(), cache_path)
+    geocoded = geocoder.geocode(df, cache_path=cache_path, legacy_cache_path=os.path.join(workdir, 'none.pkl'),
+                                offline=True)
+
+    scored, df_clean = pipeline.score(geocoded)
+    summaries = pipeline.summarize(scored, df_clean)
+
+    tables = {'raw': df, 'geocoded': geocoded, 'scored': df_clean, 'markers': marker_table(df_clean)}
+    counts = {}
+    for key, value in summaries.items():
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            tables[key] = value
+        else:
+            counts[key] = value
+    tables['counts'] = pd.DataFrame([counts])
+    return tables
+
+
+## 2. 표 저장 / 읽기
+# Parquet에 맞게 정리: 인덱스는 컬럼으로, 타입이 섞인 컬럼은 문자열로
+def normalize_table(table):
+    if isinstance(table, pd.Series):
+        table = table.to_frame(table.name if table.name is not None else 'value')
+    if isinstance(table.index, pd.RangeIndex) and table.index.start == 0 and table.index.step == 1:
+        table = table.reset_index(drop=True)
+    else:
+        table = table.reset_index()
+    table = table.copy()
+    table.columns = [str(c) for c in table.columns]
+    for col in table.columns:
+        values = table[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(object)
+        if values.dtype == object:
+            types = {type(v) for v in values.dropna()}
+            if len(types) > 1 or (types and not types <= {str, bool}):
+                values = values.where(values.isna(), values.astype(str))
+        table[col] = values
+    return table
+
+
+def save_tables(tables, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    for name, table in tables.items():
+        normalize_table(table).to_parquet(os.path.join(out_dir, f'{name}.parquet'), index=False)
+    return sorted(tables)
+
+
+def load_tables(table_dir):
+    return {
+        os.path.splitext(file_name)[0]: pd.read_parquet(os.path.join(table_dir, file_name))
+        for file_name in sorted(os.listdir(table_dir)) if file_name.endswith('.parquet')
+    }
+
+
+## 3. 컬럼 단위 비교
+def column_mismatch(expected, actual, rtol=RTOL, atol=ATOL):
+    if pd.api.types.is_numeric_dtype(expected) and pd.api.types.is_numeric_dtype(actual):
+        return ~np.isclose(expected.to_numpy(dtype=float), actual.to_numpy(dtype=float),
+                           rtol=rtol, atol=atol, equal_nan=True)
+    a, b = expected.astype(object), actual.astype(object)
+    both_missing = (a.isna() & b.isna()).to_numpy()
+    equal = (a.to_numpy() == b.to_numpy())
+    return ~(equal | both_missing)
+
+
+def diff_table(name, expected, actual, rtol=RTOL, atol=ATOL):
+    rows = []
+    if len(expected) != len(actual):
+        return [{'table': name, 'column': '', 'status': '행 수 다름', 'n_diff': abs(len(expected) - len(actual)),
+                 'example': f'기준 {len(expected)}행 / 현재 {len(actual)}행'}]
+    for col in expected.columns.difference(actual.columns, sort=False):
+        rows.append({'table': name, 'column': col, 'status': '컬럼 없음', 'n_diff': len(expected), 'example': ''})
+    for col in actual.columns.difference(expected.columns, sort=False):
+        rows.append({'table': name, 'column': col, 'status': '새 컬럼', 'n_diff': len(actual), 'example': ''})
+    for col in expected.columns.intersection(actual.columns, sort=False):
+        mismatch = column_mismatch(expected[col], actual[col], rtol, atol)
+        if mismatch.any():
+            idx = np.flatnonzero(mismatch)[:MAX_EXAMPLES]
+            pairs = zip(idx, expected[col].iloc[idx].tolist(), actual[col].iloc[idx].tolist())
+            example = ', '.join(f'{i}행: {a!r} -> {b!r}' for i, a, b in pairs)
+            rows.append({'table': name, 'column': col, 'status': '값 다름', 'n_diff': int(mismatch.sum()),
+                         'example': example})
+    return rows
+
+
+def diff_tables(expected, actual, rtol=RTOL, atol=ATOL):
+    rows = []
+    for name in sorted(set(expected) | set(actual)):
+        if name not in actual:
+            rows.append({'table': name, 'column': '', 'status': '표 없음', 'n_diff': len(expected[name]), 'example': ''})
+        elif name not in expected:
+            rows.append({'table': name, 'column': '', 'status': '새 표', 'n_diff': len(actual[name]), 'example': ''})
+        else:
+            rows.extend(diff_table(name, expected[name], actual[name], rtol, atol))
+    return pd.DataFrame(rows, columns=['table', 'column', 'status', 'n_diff', 'example'])
+
+
+## 4. 기준 결과 기록 / 확인
+def record(expected_dir=EXPECTED_DIR):
+    with tempfile.TemporaryDirectory() as workdir:
+        return save_tables(run_fixture(workdir), expected_dir)
+
+
+# 현재 결과도 Parquet을 거쳐 읽어서 기준과 같은 타입으로 비교
+def check(expected_dir=EXPECTED_DIR, rtol=RTOL, atol=ATOL, actual_dir=None):
+    if not os.path.isdir(expected_dir):
+        raise FileNotFoundError(f"기준 결과가 없습니다: {expected_dir} (golden record를 먼저 실행하세요)")
+    with tempfile.TemporaryDirectory() as workdir:
+        actual_dir = actual_dir or os.path.join(workdir, 'actual')
+        save_tables(run_fixture(workdir), actual_dir)
+        actual = load_tables(actual_dir)
+    return diff_tables(load_tables(expected_dir), actual, rtol, atol)
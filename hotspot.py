@@ -0,0 +1,174 @@
+import json
+import re
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+from sklearn.cluster import DBSCAN
+from sklearn.neighbors import BallTree
+
+EARTH_RADIUS_M = 6371008.8
+
+
+def to_radians(df):
+    return np.radians(df[['latitude', 'longitude']].to_numpy(dtype=float))
+
+
+# 도로명 추출 (예: '서울특별시 용산구 청파로 12' -> '청파로')
+def extract_road(address):
+    if not isinstance(address, str):
+        return None
+    match = re.search(r'([가-힣0-9]+(?:대로|로|길))\s', address + ' ')
+    return match.group(1) if match else None
+
+
+## 1. DBSCAN 군집 (haversine + BallTree, 거리 행렬을 만들지 않음)
+def dbscan_hotspots(points, eps_m=300, min_samples=5):
+    points = points.dropna(subset=['latitude', 'longitude']).copy()
+    if points.empty:
+        points['cluster'] = pd.Series(dtype=int)
+        return points
+    model = DBSCAN(eps=eps_m / EARTH_RADIUS_M, min_samples=min_samples, metric='haversine', algorithm='ball_tree')
+    points['cluster'] = model.fit_predict(to_radians(points))
+    return points
+
+
+# 볼록 껍질 (monotone chain), 입력/출력은 (경도, 위도)
+def convex_hull(xy):
+    xy = np.unique(xy, axis=0)
+    if len(xy) < 3:
+        return xy
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower, upper = [], []
+    for p in xy:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    for p in xy[::-1]:
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return np.array(lower[:-1] + upper[:-1])
+
+
+# 점이 너무 적거나 한 줄로 늘어선 군집은 중심 기준 원형 다각형으로 대체
+def circle_polygon(lat, lon, radius_m, n=16):
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    dlat = np.degrees(radius_m / EARTH_RADIUS_M) * np.sin(angles)
+    dlon = np.degrees(radius_m / EARTH_RADIUS_M) * np.cos(angles) / np.cos(np.radians(lat))
+    return np.column_stack([lon + dlon, lat + dlat])
+
+
+def cluster_polygon(group, eps_m):
+    hull = convex_hull(group[['longitude', 'latitude']].to_numpy(dtype=float))
+    if len(hull) < 3:
+        return circle_polygon(group['latitude'].mean(), group['longitude'].mean(), eps_m)
+    return hull
+
+
+## 2. 군집 순위 및 다각형
+def cluster_summary(points, eps_m=300):
+    clustered = points[points['cluster'] >= 0]
+    rows = []
+    for cluster, group in clustered.groupby('cluster'):
+        lat, lon = group['latitude'].mean(), group['longitude'].mean()
+        roads = group['address_road'].map(extract_road).dropna().value_counts()
+        districts = group['district'].dropna().value_counts()
+        polygon = cluster_polygon(group, eps_m)
+        rows.append({
+            'cluster': cluster,
+            'n_points': len(group),
+            'region': group['region'].mode().iat[0],
+            'district': districts.index[0] if len(districts) else None,
+            'top_roads': ', '.join(roads.index[:3]),
+            'latitude': lat,
+            'longitude': lon,
+            'mean_accessibility': group['accessibility_score'].mean().round(2),
+            'mean_safety': group['safety_score'].mean().round(2),
+            'polygon': [[round(x, 6), round(y, 6)] for x, y in polygon]
+        })
+    summary = pd.DataFrame(rows, columns=[
+        'cluster', 'n_points', 'region', 'district', 'top_roads', 'latitude', 'longitude',
+        'mean_accessibility', 'mean_safety', 'polygon'
+    ])
+    summary = summary.sort_values('n_points', ascending=False).reset_index(drop=True)
+    summary.insert(0, 'rank', np.arange(1, len(summary) + 1))
+    return summary
+
+
+## 3. Getis-Ord Gi* (거리 기준 이진 가중치, 자기 자신 포함)
+def getis_ord_gi(df, value, bandwidth_m=500):
+    df = df.dropna(subset=['latitude', 'longitude']).copy()
+    x = np.asarray(df[value], dtype=float)
+    n = len(x)
+    if n < 2:
+        df['gi_neighbors'] = 1
+        df['gi_z'] = np.nan
+        df['gi_p'] = np.nan
+        df['gi_class'] = '유의하지 않음'
+        return df
+
+    coords = to_radians(df)
+    tree = BallTree(coords, metric='haversine')
+    neighbors = tree.query_radius(coords, r=bandwidth_m / EARTH_RADIUS_M)
+
+    # 이웃 목록을 평탄화해서 bincount로 합산
+    k = np.array([len(idx) for idx in neighbors])
+    owner = np.repeat(np.arange(n), k)
+    flat = np.concatenate(neighbors)
+    local_sum = np.bincount(owner, weights=x[flat], minlength=n)
+
+    x_bar = x.mean()
+    s = np.sqrt((x ** 2).mean() - x_bar ** 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        denom = s * np.sqrt((n * k - k ** 2) / (n - 1))
+        z = (local_sum - x_bar * k) / denom
+    df['gi_neighbors'] = k
+    df['gi_z'] = z
+    df['gi_p'] = 2 * norm.sf(np.abs(z))
+    df['gi_class'] = np.select(
+        [z >= 2.576, z >= 1.960, z >= 1.645, z <= -2.576, z <= -1.960, z <= -1.645],
+        ['핫스팟 99%', '핫스팟 95%', '핫스팟 90%', '콜드스팟 99%', '콜드스팟 95%', '콜드스팟 90%'],
+        default='유의하지 않음'
+    )
+    return df
+
+
+## 4. 대상 지점 (critical_points / risk_df) 핫스팟 분석
+# target은 df_clean의 부분집합 (같은 인덱스)
+def detect_hotspots(df_clean, target, eps_m=300, min_samples=5, bandwidth_m=500):
+    df_clean = df_clean.copy()
+    df_clean['is_target'] = df_clean.index.isin(target.index).astype(int)
+
+    points = dbscan_hotspots(df_clean[df_clean['is_target'] == 1], eps_m=eps_m, min_samples=min_samples)
+    summary = cluster_summary(points, eps_m=eps_m)
+
+    # 군집별 Gi* 평균 (전체 지점 대비 대상 지점 밀집도)
+    gi = getis_ord_gi(df_clean, 'is_target', bandwidth_m=bandwidth_m)
+    points = points.join(gi[['gi_z', 'gi_class']])
+    if not summary.empty:
+        gi_mean = points[points['cluster'] >= 0].groupby('cluster')['gi_z'].mean().round(2)
+        summary['mean_gi_z'] = summary['cluster'].map(gi_mean)
+    return points, summary, gi
+
+
+# 군집 다각형을 GeoJSON FeatureCollection으로 변환
+def hotspots_geojson(summary):
+    features = []
+    for row in summary.itertuples(index=False):
+        ring = list(row.polygon) + [row.polygon[0]]
+        properties = {k: v for k, v in row._asdict().items() if k != 'polygon'}
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'Polygon', 'coordinates': [ring]},
+            'properties': json.loads(pd.Series(properties).to_json(force_ascii=False))
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def save_geojson(summary, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(hotspots_geojson(summary), f, ensure_ascii=False)
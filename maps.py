@@ -0,0 +1,282 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import folium
+import numpy as np
+import pandas as pd
+from branca.element import MacroElement
+from folium.plugins import MarkerCluster
+from folium.template import Template
+
+from pipeline import fingerprint
+
+MAP_CENTER = [36.0, 127.5]
+
+# 마커 모양 (None이면 CircleMarker)
+MARKER_ICONS = {
+    'circle': None,
+    'risk': ('red', 'exclamation-sign'),
+    'critical': ('darkred', 'exclamation-sign')
+}
+
+# 기존 지도 파일 이름 (보고서에서 링크)
+VARIANT_FILES = {
+    'all': 'restroom_map_clean.html',
+    'risky': 'risk_restroom_map.html',
+    'critical': 'critical_points_map.html'
+}
+LAYERED_FILE = 'restroom_maps.html'
+
+VARIANT_TITLES = {
+    'all': '전체 공중화장실',
+    'risky': '위험 지점',
+    'critical': '최우선 개선 대상'
+}
+
+# 팝업에 들어가는 값 (지점별 배열로 저장)
+POINT_COLUMNS = ['latitude', 'longitude', 'name', 'region', 'district', 'accessibility_score', 'safety_score',
+                 'recommendation']
+# 반복되는 문자열은 조회 테이블 + 번호로 저장
+INTERNED_COLUMNS = ['region', 'district', 'recommendation']
+PAYLOAD_KEYS = {
+    'latitude': 'lat', 'longitude': 'lon', 'name': 'name', 'region': 'region', 'district': 'district',
+    'accessibility_score': 'acc', 'safety_score': 'safety', 'recommendation': 'rec'
+}
+
+
+# 색상 함수 (접근성 점수 기준)
+def get_color(score):
+    if score >= 3:
+        return 'green'
+    elif score >= 2:
+        return 'orange'
+    else:
+        return 'red'
+
+
+## 1. 공통 지점 테이블 (모든 지도가 함께 쓰는 값을 한 번만 계산)
+def point_table(df_clean):
+    acc = df_clean['accessibility_score'].astype(float)
+    safety = df_clean['safety_score'].astype(float)
+    name = df_clean['toilet_name'] if 'toilet_name' in df_clean.columns else df_clean['address_road']
+    points = pd.DataFrame({
+        'latitude': df_clean['latitude'].astype(float).round(6),
+        'longitude': df_clean['longitude'].astype(float).round(6),
+        'name': name.fillna('주소 없음').astype(str),
+        'region': df_clean['region_by_coord'].fillna('지역 없음').astype(str),
+        'district': df_clean['district'].fillna('구 정보 없음').astype(str),
+        'accessibility_score': acc,
+        'safety_score': safety,
+        'recommendation': df_clean['recommendation'].fillna('전략 없음').astype(str),
+        'risk_type': df_clean['risk_type'],
+        'is_risky': df_clean['is_risky'].astype(bool),
+        # summarize()의 critical_points와 같은 기준
+        'is_critical': (acc == 0.0) & (safety == 0.0)
+    })
+    return points.reset_index(drop=True)
+
+
+## 2. 지도 종류 (이름 -> 지점 위치, 마커 모양, 개선 전략 표시 여부)
+def map_variants(points, by_region=False, by_risk_type=False):
+    variants = {
+        'all': (np.arange(len(points)), 'circle', False),
+        'risky': (np.flatnonzero(points['is_risky']), 'risk', True),
+        'critical': (np.flatnonzero(points['is_critical']), 'critical', True)
+    }
+    if by_region:
+        for region in points['region'].dropna().unique():
+            variants[f'region_{region}'] = (np.flatnonzero(points['region'] == region), 'circle', False)
+    if by_risk_type:
+        for risk_type in points['risk_type'].dropna().unique():
+            variants[f'risk_type_{risk_type}'] = (np.flatnonzero(points['risk_type'] == risk_type), 'circle', True)
+    return variants
+
+
+def variant_file(name):
+    return VARIANT_FILES.get(name, f'map_{name}.html')
+
+
+## 3. 팝업 데이터 (문자열 조회 테이블 + 컬럼별 지점 배열, JSON 문자열)
+def to_json(obj):
+    # </script> 가 HTML을 끊지 않도록
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+
+def intern_strings(points):
+    lookup = {}
+    for col in INTERNED_COLUMNS:
+        codes, uniques = pd.factorize(points[col])
+        lookup[PAYLOAD_KEYS[col]] = (codes, list(uniques))
+    return lookup
+
+
+def point_payload(points, lookup):
+    data = {}
+    for col in POINT_COLUMNS:
+        key = PAYLOAD_KEYS[col]
+        data[key] = lookup[key][0].tolist() if key in lookup else points[col].tolist()
+    return to_json(data)
+
+
+def lookup_payload(lookup):
+    return to_json({key: uniques for key, (_, uniques) in lookup.items()})
+
+
+# 지도별 JSON (데이터 지문 기준 캐시)
+def build_payloads(points, variants, layered=False, cache_dir=None):
+    path = None
+    if cache_dir:
+        key = fingerprint(points, [], POINT_COLUMNS + ['risk_type', 'is_risky', 'is_critical'],
+                          variants=sorted(variants), layered=layered, intern='layer' if layered else 'variant')
+        path = os.path.join(cache_dir, f'popups_{key}.pkl')
+        if os.path.exists(path):
+            return pd.read_pickle(path)
+
+    if layered:
+        # 조회 테이블과 지점 배열은 한 번만, 레이어는 지점 번호만
+        lookup = intern_strings(points)
+        payloads = {
+            'lookup': lookup_payload(lookup),
+            'points': point_payload(points, lookup),
+            'variants': {name: to_json(positions.tolist()) for name, (positions, _, _) in variants.items()}
+        }
+    else:
+        # 지도별 파일에는 그 지도에 나오는 문자열만
+        payloads = {'variants': {}}
+        for name, (positions, _, _) in variants.items():
+            subset = points.iloc[positions]
+            lookup = intern_strings(subset)
+            payloads['variants'][name] = (lookup_payload(lookup), point_payload(subset, lookup))
+
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        pd.to_pickle(payloads, path)
+    return payloads
+
+
+## 4. 브라우저에서 마커 / 팝업 생성
+class PointData(MacroElement):
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = (function(){
+                var lookup = {{ this.lookup }};
+                var points = {{ this.points }};
+                function score(value, decimal) {
+                    return decimal && Number.isInteger(value) ? value.toFixed(1) : String(value);
+                }
+                return {
+                    points: points,
+                    popup: function(i, strategy, decimal) {
+                        var html = '<b>' + points.name[i] + '</b><br>' +
+                            '📍 ' + lookup.region[points.region[i]] + ' / ' + lookup.district[points.district[i]] + '<br>' +
+                            '🚻 접근성 점수: ' + score(points.acc[i], decimal) + '<br>' +
+                            '🛡️ 안전성 점수: ' + score(points.safety[i], decimal);
+                        if (strategy) {
+                            html += '<br>🛠️ 개선 전략: ' + lookup.rec[points.rec[i]];
+                        }
+                        return html;
+                    }
+                };
+            })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, lookup, points):
+        super().__init__()
+        self._name = 'PointData'
+        self.lookup = lookup
+        self.points = points
+
+
+class PointLayer(MarkerCluster):
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = (function(){
+                var data = {{ this.data.get_name() }};
+                var positions = {{ this.positions }};
+                var cluster = L.markerClusterGroup({{ this.options|tojavascript }});
+                {%- if this.icon is not none %}
+                var icon = L.AwesomeMarkers.icon({icon: '{{ this.icon[1] }}', markerColor: '{{ this.icon[0] }}',
+                                                  prefix: 'glyphicon', iconColor: 'white'});
+                {%- endif %}
+                var n = positions ? positions.length : data.points.lat.length;
+                for (var k = 0; k < n; k++) {
+                    var i = positions ? positions[k] : k;
+                    var latlng = [data.points.lat[i], data.points.lon[i]];
+                    {%- if this.icon is none %}
+                    var acc = data.points.acc[i];
+                    var marker = L.circleMarker(latlng, {
+                        radius: 10 + acc, color: acc >= 3 ? 'green' : (acc >= 2 ? 'orange' : 'red'),
+                        fill: true, fillOpacity: 0.7
+                    });
+                    {%- else %}
+                    var marker = L.marker(latlng, {icon: icon});
+                    {%- endif %}
+                    marker.bindPopup(data.popup.bind(null, i, {{ 'true' if this.strategy else 'false' }},
+                                                     {{ 'true' if this.decimal else 'false' }}), {maxWidth: 300});
+                    marker.addTo(cluster);
+                }
+                return cluster;
+            })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, data, positions=None, marker='circle', strategy=False, **kwargs):
+        super().__init__(**kwargs)
+        self._name = 'PointLayer'
+        self.data = data
+        self.positions = positions or 'null'
+        self.icon = MARKER_ICONS[marker]
+        self.strategy = strategy
+        # 기존 지도와 같은 점수 표기: 원형 마커 지도는 '4', 위험·최우선 지도는 '4.0'
+        self.decimal = self.icon is not None
+
+
+## 5. 지도 생성
+def build_map(lookup, points, marker='circle', strategy=False):
+    m = folium.Map(location=MAP_CENTER, zoom_start=7)
+    data = PointData(lookup, points).add_to(m)
+    PointLayer(data, marker=marker, strategy=strategy).add_to(m)
+    return m
+
+
+# 모든 지도를 레이어로 가진 지도 한 장 (지점 데이터는 한 번만, 첫 레이어만 켜진 상태)
+def build_layered_map(payloads, variants):
+    m = folium.Map(location=MAP_CENTER, zoom_start=7)
+    data = PointData(payloads['lookup'], payloads['points']).add_to(m)
+    for i, (name, (_, marker, strategy)) in enumerate(variants.items()):
+        PointLayer(data, payloads['variants'][name], marker=marker, strategy=strategy,
+                   name=VARIANT_TITLES.get(name, name), show=(i == 0)).add_to(m)
+    folium.LayerControl(collapsed=False).add_to(m)
+    return m
+
+
+# 작업 프로세스에서 실행 (해당 지도의 JSON만 전달받음)
+def save_variant(lookup, points, marker, strategy, path):
+    build_map(lookup, points, marker, strategy).save(path)
+    return path
+
+
+## 6. 지도 저장 (지도별 파일은 병렬 프로세스로)
+def export_maps(df_clean, out_dir='.', by_region=False, by_risk_type=False, layered=False, workers=None,
+                cache_dir=None):
+    points = point_table(df_clean)
+    variants = map_variants(points, by_region=by_region, by_risk_type=by_risk_type)
+    payloads = build_payloads(points, variants, layered=layered, cache_dir=cache_dir)
+
+    if layered:
+        path = os.path.join(out_dir, LAYERED_FILE)
+        build_layered_map(payloads, variants).save(path)
+        return [path]
+
+    jobs = [
+        (*payloads['variants'][name], marker, strategy, os.path.join(out_dir, variant_file(name)))
+        for name, (_, marker, strategy) in variants.items()
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [save_variant(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(save_variant, *job) for job in jobs]
+        return [future.result() for future in futures]
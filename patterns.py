@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+from facility_stats import group_codes, yes_flag
+
+# 비트 순서대로의 시설 플래그 (비트 번호 = 리스트 순서)
+FLAG_NAMES = ['장애인화장실', '기저귀교환대', '비상벨', 'CCTV', '안전관리시설']
+FLAG_COLUMNS = [None, 'has_diaper_table', 'emergency_bell_installed', 'has_cctv', 'safety_facility_required']
+N_FLAGS = len(FLAG_NAMES)
+N_COMBOS = 1 << N_FLAGS
+
+# 접근성 / 안전성 관련 비트
+ACCESS_BITS = 0b00011
+SAFETY_BITS = 0b11100
+
+# 모든 조합(0 ~ 31)의 비트 행렬과 점수 (조합 단위 계산용)
+COMBO_BITS = (np.arange(N_COMBOS)[:, None] >> np.arange(N_FLAGS)) & 1
+COMBO_SAFETY = COMBO_BITS[:, (SAFETY_BITS >> np.arange(N_FLAGS) & 1) == 1].sum(axis=1)
+
+
+def combo_label(mask):
+    names = [name for bit, name in enumerate(FLAG_NAMES) if mask >> bit & 1]
+    return '+'.join(names) if names else '없음'
+
+
+COMBO_LABELS = [combo_label(mask) for mask in range(N_COMBOS)]
+
+
+# 화장실마다 시설 보유 여부를 5비트 마스크로 인코딩 (점수와 같은 판정: 'Y'만 설치)
+def encode_restrooms(df):
+    disabled = (
+        pd.to_numeric(df['male_disabled_toilet_count'], errors='coerce').fillna(0) +
+        pd.to_numeric(df['female_disabled_toilet_count'], errors='coerce').fillna(0)
+    ) > 0
+    mask = disabled.to_numpy().astype(np.int64)
+    for bit, col in enumerate(FLAG_COLUMNS):
+        if col is not None:
+            mask |= yes_flag(df[col]).to_numpy().astype(np.int64) << bit
+    return mask
+
+
+# 그룹 x 조합 개수 행렬 (bincount 한 번)
+def combination_counts(df, by=('region', 'district')):
+    codes, groups = group_codes(df, list(by or []))
+    mask = encode_restrooms(df)
+    counts = np.bincount(codes * N_COMBOS + mask, minlength=len(groups) * N_COMBOS).reshape(len(groups), N_COMBOS)
+    return groups, counts
+
+
+# 시설이 서로 독립일 때의 기대 개수 (그룹별 설치율의 곱)
+def expected_counts(counts):
+    totals = counts.sum(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rates = (counts @ COMBO_BITS) / totals  # 그룹 x 시설 설치율
+    rates = np.nan_to_num(rates)
+    probs = np.where(COMBO_BITS[None, :, :] == 1, rates[:, None, :], 1 - rates[:, None, :]).prod(axis=2)
+    return probs * totals
+
+
+## 조합별 과대 / 과소 대표 분석
+def combination_table(df, by=('region', 'district'), min_count=5, over_lift=1.5, under_lift=0.5):
+    groups, counts = combination_counts(df, by)
+    expected = expected_counts(counts)
+    totals = counts.sum(axis=1, keepdims=True)
+
+    n_groups = len(groups)
+    result = groups.loc[groups.index.repeat(N_COMBOS)].reset_index(drop=True)
+    result['mask'] = np.tile(np.arange(N_COMBOS), n_groups)
+    result['combination'] = np.tile(COMBO_LABELS, n_groups)
+    result['count'] = counts.ravel()
+    result['expected'] = expected.ravel().round(2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result['share'] = (counts / totals * 100).ravel().round(1)
+        result['lift'] = (counts / expected).ravel().round(2)
+        result['z'] = ((counts - expected) / np.sqrt(expected)).ravel().round(2)
+
+    result['pattern'] = np.select(
+        [(result['count'] >= min_count) & (result['lift'] >= over_lift),
+         (result['expected'] >= min_count) & (result['lift'] <= under_lift)],
+        ['과대', '과소'],
+        default=''
+    )
+    # 관측도 기대도 없는 조합은 제외
+    return result[(result['count'] > 0) | (result['expected'] >= 0.5)].reset_index(drop=True)
+
+
+# 조건부 비율: condition을 만족하는 화장실 중 outcome을 만족하는 비율 (조합 단위로 계산)
+# condition, outcome: 조합 마스크 배열(0 ~ 31)을 받아 bool 배열을 돌려주는 함수
+def conditional_rate(counts, condition, outcome):
+    masks = np.arange(N_COMBOS)
+    cond = condition(masks)
+    both = cond & outcome(masks)
+    base = counts[:, cond].sum(axis=1)
+    hits = counts[:, both].sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return base, hits, hits / base
+
+
+## 시설 쌍별 조건부 결핍률: A가 없을 때 B도 없을 확률 vs B가 없을 확률
+def conditional_deficiency(df, by=('region', 'district')):
+    groups, counts = combination_counts(df, by)
+    totals = counts.sum(axis=1)
+    missing = [lambda m, bit=bit: (m >> bit & 1) == 0 for bit in range(N_FLAGS)]
+    frames = []
+    for a in range(N_FLAGS):
+        for b in range(N_FLAGS):
+            if a == b:
+                continue
+            base, hits, rate = conditional_rate(counts, missing[a], missing[b])
+            _, _, overall = conditional_rate(counts, lambda m: m >= 0, missing[b])
+            frame = groups.copy()
+            frame['given_missing'] = FLAG_NAMES[a]
+            frame['missing'] = FLAG_NAMES[b]
+            frame['n_given'] = base
+            frame['n_both'] = hits
+            frame['conditional_rate'] = (rate * 100).round(1)
+            frame['overall_rate'] = (overall * 100).round(1)
+            frame['total'] = totals
+            frames.append(frame)
+    result = pd.concat(frames, ignore_index=True)
+    result['ratio'] = (result['conditional_rate'] / result['overall_rate']).round(2)
+    return result
+
+
+## 접근성 0인 지점의 안전성 점수 분포 (수작업 집계 자동화)
+# 점수 컬럼(compute_scores 결과) 기준이라 위험 / 최우선 개선 대상 집계와 같은 'Y' 판정을 따름
+def safety_given_zero_access(df, by=('region',)):
+    codes, groups = group_codes(df, list(by or []))
+    n_levels = COMBO_SAFETY.max() + 1
+    zero_access = df['accessibility_score'].to_numpy() == 0
+    safety = df['safety_score'].to_numpy().astype(np.int64)
+    counts = np.bincount(codes[zero_access] * n_levels + safety[zero_access],
+                         minlength=len(groups) * n_levels).reshape(len(groups), n_levels)
+    result = groups.copy()
+    for s in range(n_levels):
+        result[f'safety_{s}'] = counts[:, s]
+    return result
@@ -0,0 +1,294 @@
+import functools
+import hashlib
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from facility_stats import bell_coverage, facility_coverage, location_breakdown, yes_flag
+from patterns import safety_given_zero_access
+
+# Kakao API 키 (환경변수가 있으면 우선 사용)
+KAKAO_API_KEY = os.environ.get('KAKAO_API_KEY', 'f7c14e0af56202194b7f0f1c3bd830f6')
+
+# 파일 경로
+DATA_PATH = 'C:/Users/anton/restroom_data/'
+
+# 지역별 원본 파일
+SOURCE_FILES = {
+    '서울': '서울_공중화장실정보.xlsx',
+    '부산': '부산_공중화장실정보.xlsx',
+    '제주도': '제주도_공중화장실정보.xlsx'
+}
+
+# 컬럼명 영문화
+rename_dict = {
+    # 접근성 관련
+    '남성용-장애인용대변기수': 'male_disabled_toilet_count',
+    '여성용-장애인용대변기수': 'female_disabled_toilet_count',
+    '기저귀교환대유무': 'has_diaper_table',
+    '기저귀교환대장소': 'diaper_table_location',
+    'WGS84위도': 'latitude',
+    'WGS84경도': 'longitude',
+    '소재지도로명주소': 'address_road',
+    '소재지지번주소': 'address_lot',
+    # 안전성 관련
+    '비상벨설치여부': 'emergency_bell_installed',
+    '비상벨설치장소': 'emergency_bell_location',
+    '화장실입구CCTV설치유무': 'has_cctv',
+    '안전관리시설설치대상여부': 'safety_facility_required'
+}
+
+# 단계별 중간 결과 파일 (작업 폴더 기준)
+STAGE_FILES = {
+    'ingest': 'raw.pkl',
+    'geocode': 'geocoded.pkl',
+    'score': 'scored.pkl',
+    'summary': 'summaries.pkl',
+    'route': 'route.pkl',
+    'profile': 'profile.pkl'
+}
+
+
+# 작업 폴더의 단계별 결과 경로
+def stage_path(workdir, stage):
+    return os.path.join(workdir, STAGE_FILES[stage])
+
+
+def save_stage(obj, workdir, stage):
+    os.makedirs(workdir, exist_ok=True)
+    pd.to_pickle(obj, stage_path(workdir, stage))
+
+
+def load_stage(workdir, stage):
+    path = stage_path(workdir, stage)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"'{stage}' 단계 결과가 없습니다: {path} (이전 단계를 먼저 실행하세요)")
+    return pd.read_pickle(path)
+
+
+## 1. 데이터 불러오기
+# 원본은 엑셀, CSV 추출본(고정 테스트 데이터 등)도 같은 컬럼이면 사용 가능
+def read_source(file_path):
+    if file_path.lower().endswith('.csv'):
+        return pd.read_csv(file_path, encoding='utf-8-sig')
+    return pd.read_excel(file_path)
+
+
+def load_raw(path=DATA_PATH, source_files=SOURCE_FILES):
+    frames = []
+    for region, file_name in source_files.items():
+        region_df = read_source(os.path.join(path, file_name))
+        region_df = region_df.rename(columns=rename_dict)
+        region_df['region'] = region
+        frames.append(region_df)
+
+    # 데이터 통합
+    df = pd.concat(frames, ignore_index=True)
+
+    # 주소 결합 (도로명 주소가 없으면 지번 주소)
+    road = df.get('address_road', pd.Series(np.nan, index=df.index))
+    lot = df.get('address_lot', pd.Series(np.nan, index=df.index))
+    has_road = road.notna() & (road.astype(str).str.strip() != '')
+    df['full_address'] = road.where(has_road, lot)
+    df['facility_key'] = unique_facility_keys(df)
+    return df
+
+
+## 2. 점수 계산
+# 설치 여부 컬럼을 점수와 같은 판정('Y'만 설치)으로 맞춤 -> 보고서의 설치율·장소 집계가 점수와 어긋나지 않도록
+# 빈 값은 그대로 두어 값 누락으로 집계
+SCORE_FLAG_COLUMNS = ['has_diaper_table', 'emergency_bell_installed', 'has_cctv', 'safety_facility_required']
+
+
+def score_flags(df):
+    df = df.copy()
+    for col in SCORE_FLAG_COLUMNS:
+        flag = pd.Series(np.where(yes_flag(df[col]) == 1, 'Y', 'N'), index=df.index)
+        df[col] = flag.where(df[col].notna())
+    return df
+
+
+def compute_scores(df):
+    df = df.copy()
+
+    # 접근성 점수 계산
+    df['accessibility_score'] = (
+        df['male_disabled_toilet_count'].fillna(0).astype(int) +
+        df['female_disabled_toilet_count'].fillna(0).astype(int) +
+        yes_flag(df['has_diaper_table'])
+    )
+
+    # 안전성 점수 계산
+    df['safety_score'] = (
+        yes_flag(df['emergency_bell_installed']) +
+        yes_flag(df['has_cctv']) +
+        yes_flag(df['safety_facility_required'])
+    )
+    return df
+
+
+# '구' 추출 함수 (같은 주소는 한 번만 해석)
+@functools.lru_cache(maxsize=None)
+def extract_gu(address):
+    if not isinstance(address, str):
+        return None
+    match = re.search(r'([가-힣]+구)\b', address)
+    if match:
+        gu = match.group(1)
+        if gu in ['출입구', '입구', '출구']:
+            return None
+        return gu
+    return None
+
+
+def assign_district(df, admin=None):
+    df = df.copy()
+    is_city = df['region'].isin(['서울', '부산'])
+    df['district'] = None
+    df.loc[is_city, 'district'] = df.loc[is_city, 'address_road'].map(extract_gu)
+    df.loc[df['region'] == '제주도', 'district'] = df.loc[df['region'] == '제주도', 'address_road']  # 제주도는 주소 그대로
+
+    # 행정경계 공간 조인 결과가 있으면 좌표 기준 시/군/구 우선 (경계 밖이면 주소 기준 유지)
+    if admin is not None:
+        df[admin.columns] = admin
+        df['district'] = admin['sigungu'].where(admin['sigungu'].notna(), df['district'])
+    return df
+
+
+# 데이터 지문 (값 + 그룹 + 설정이 같으면 같은 결과)
+def fingerprint(df, by, columns, **params):
+    h = hashlib.sha1()
+    h.update(pd.util.hash_pandas_object(df[list(by) + list(columns)], index=False).to_numpy().tobytes())
+    h.update(repr(sorted(params.items())).encode('utf-8'))
+    return h.hexdigest()[:16]
+
+
+# 시설 고유 키: 지역 + 주소(도로명 없으면 지번) + 화장실명, 공백 정규화 후 해시
+# 좌표는 지오코딩 결과에 따라 바뀔 수 있으므로 키에 넣지 않음
+def facility_key(df):
+    def column(name):
+        if name in df.columns:
+            return df[name].astype(str).where(df[name].notna(), '')
+        return pd.Series('', index=df.index)
+
+    address = column('address_road').where(column('address_road') != '', column('address_lot'))
+    name = column('toilet_name').where(column('toilet_name') != '', column('화장실명'))
+    raw = (column('region') + '|' + address + '|' + name).str.replace(r'\s+', ' ', regex=True).str.strip()
+
+    # 고유 문자열마다 한 번만 해시
+    codes, uniques = pd.factorize(raw)
+    hashes = np.array([hashlib.blake2b(u.encode('utf-8'), digest_size=8).hexdigest() for u in uniques], dtype=object)
+    return pd.Series(hashes[codes], index=df.index, name='facility_key')
+
+
+# 지역·주소·이름이 모두 같은 시설은 원본 순서대로 '#1', '#2' ... 를 붙여 구분
+# 필터링 전 전체 원본에서 한 번만 매김 (걸러진 행이 있어도 남은 시설의 키가 바뀌지 않도록)
+def unique_facility_keys(df):
+    keys = facility_key(df)
+    ordinal = keys.groupby(keys).cumcount()
+    return keys.where(ordinal == 0, keys + '#' + ordinal.astype(str))
+
+
+# 좌표 기반 지역 분류 (위도 + 경도 기준, 벡터 연산)
+def classify_region_by_latlon(lat, lon):
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    conditions = [
+        (33 < lat) & (lat < 34.5) & (126 < lon) & (lon < 127.2),
+        (34.8 < lat) & (lat < 35.4) & (128.8 < lon) & (lon < 129.3),
+        (37.4 < lat) & (lat < 37.7) & (126.8 < lon) & (lon < 127.2)
+    ]
+    return np.select(conditions, ['제주도', '부산', '서울'], default='기타')
+
+
+# 위험 유형별 개선 전략
+RISK_STRATEGY = {
+    '접근성만 낮음': '진입로 개선, 장애인 접근성 강화',
+    '안전성만 낮음': '조명, CCTV, 주변 환경 정비',
+    '둘 다 낮음': '종합 인프라 개선 필요',
+    '양호': '유지관리 중심'
+}
+
+
+def build_clean(df):
+    # 주소/좌표 누락 제거
+    df_map = df[df['address_road'].notna()].dropna(subset=['latitude', 'longitude']).copy()
+    df_map['accessibility_score'] = df_map['accessibility_score'].astype(float)
+    df_map['safety_score'] = df_map['safety_score'].astype(float)
+
+    # 좌표 기반 지역명 생성
+    df_map['region_by_coord'] = classify_region_by_latlon(df_map['latitude'], df_map['longitude'])
+
+    # 좌표 유효 범위 필터링
+    valid_lat = (df_map['latitude'] > 33) & (df_map['latitude'] < 38)
+    valid_lon = (df_map['longitude'] > 124) & (df_map['longitude'] < 132)
+    df_map = df_map[valid_lat & valid_lon]
+
+    # 지역 불일치 제거
+    df_clean = df_map[df_map['region'] == df_map['region_by_coord']].copy()
+
+    # 위험 여부 및 위험 유형 분류
+    low_access = df_clean['accessibility_score'] < 2.0
+    low_safety = df_clean['safety_score'] < 1.5
+    df_clean['is_risky'] = low_access & low_safety
+    df_clean['risk_type'] = np.select(
+        [low_access & ~low_safety, ~low_access & low_safety, low_access & low_safety],
+        ['접근성만 낮음', '안전성만 낮음', '둘 다 낮음'],
+        default='양호'
+    )
+    df_clean['recommendation'] = df_clean['risk_type'].map(RISK_STRATEGY)
+    return df_clean
+
+
+## 3. 요약 테이블
+def summarize(df, df_clean):
+    summaries = {}
+
+    # 지역별 평균 점수 비교
+    summaries['region_summary'] = df.groupby('region')[['accessibility_score', 'safety_score']].mean().round(2)
+
+    # 위험 지점 / 최우선 개선 대상
+    summaries['risk_df'] = df_clean[df_clean['is_risky']].copy()
+    summaries['critical_points'] = df_clean[
+        (df_clean['accessibility_score'] == 0.0) &
+        (df_clean['safety_score'] == 0.0)
+    ].copy()
+
+    # 위험 비율
+    risk_ratio = df_clean.groupby('region_by_coord')['is_risky'].mean().round(3)
+    summaries['risk_ratio'] = risk_ratio[risk_ratio.index != '기타']
+
+    # 지역별 위험도 요약
+    summaries['risk_summary'] = (
+        summaries['risk_df'].groupby('region_by_coord')[['accessibility_score', 'safety_score']].mean().round(2)
+    )
+
+    # 구별 평균 점수
+    summaries['district_summary'] = (
+        df_clean.groupby(['region', 'district'], dropna=False)[['accessibility_score', 'safety_score']]
+        .mean()
+        .round(2)
+        .reset_index()
+    )
+
+    # 보고서용 집계 (원본 데이터 없이 보고서를 다시 만들 수 있도록 함께 저장)
+    located = df[df['address_road'].notna()].dropna(subset=['latitude', 'longitude'])
+    summaries['n_restrooms'] = len(df)
+    summaries['n_region_mismatch'] = int(
+        (classify_region_by_latlon(located['latitude'], located['longitude']) != located['region']).sum()
+    )
+    flags = score_flags(df)
+    summaries['facility_coverage'] = facility_coverage(flags)
+    summaries['region_coverage'] = facility_coverage(flags, by='region')
+    summaries['bell_locations'] = location_breakdown(flags)
+    summaries['bell_coverage'] = bell_coverage(flags, by='region')
+    summaries['zero_access_safety'] = safety_given_zero_access(df, by=[])
+    return summaries
+
+
+def score(df, admin=None):
+    df = assign_district(compute_scores(df), admin)
+    df_clean = build_clean(df)
+    return df, df_clean
@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+
+from facility_stats import normalize_flag
+from pipeline import assign_district, classify_region_by_latlon, facility_key
+
+# Y/N 설치 여부 컬럼
+FLAG_COLUMNS = ['has_diaper_table', 'emergency_bell_installed', 'has_cctv', 'safety_facility_required']
+COUNT_COLUMNS = ['male_disabled_toilet_count', 'female_disabled_toilet_count']
+
+# 대한민국 좌표 범위 (대략)
+KOREA_LAT = (33.0, 38.7)
+KOREA_LON = (124.5, 132.0)
+
+TOP_VALUES = 5
+
+
+## 1. 컬럼별 값 범위 / 결측률
+def column_profile(df):
+    rows = []
+    for region, group in df.groupby('region', sort=False):
+        n = len(group)
+        nulls = group.isna().sum()
+        n_unique = group.nunique(dropna=True)
+        for col in group.columns:
+            if col == 'region':
+                continue
+            top = group[col].value_counts(dropna=True).head(TOP_VALUES)
+            rows.append({
+                'region': region,
+                'column': col,
+                'dtype': str(group[col].dtype),
+                'n': n,
+                'nulls': int(nulls[col]),
+                'null_rate': round(nulls[col] / n * 100, 1) if n else 0.0,
+                'n_unique': int(n_unique[col]),
+                'top_values': ', '.join(f'{v!r}:{c}' for v, c in top.items())
+            })
+    return pd.DataFrame(rows)
+
+
+## 2. 설치 여부 값 점검 ('Y'/'N' 외의 값)
+def flag_profile(df):
+    rows = []
+    for col in FLAG_COLUMNS:
+        if col not in df.columns:
+            continue
+        flag = normalize_flag(df[col])
+        raw = df[col]
+        canonical = raw.isin(['Y', 'N'])
+        frame = pd.DataFrame({
+            'region': df['region'].to_numpy(),
+            'canonical': canonical.to_numpy(),
+            'variant_yes': (flag == 1) & ~canonical.to_numpy(),
+            'variant_no': (flag == 0) & ~canonical.to_numpy(),
+            'null': raw.isna().to_numpy(),
+            'unknown': (flag == -1) & raw.notna().to_numpy()
+        })
+        counts = frame.groupby('region', sort=False).sum()
+        counts['column'] = col
+        # 원본 분석의 .map({'Y': 1, 'N': 0}).fillna(0)이 미설치로 만들어 버리는 설치 값
+        counts['zeroed_by_strict_map'] = counts['variant_yes']
+        unknown_values = raw[(flag == -1) & raw.notna().to_numpy()].astype(str).groupby(df['region']).unique()
+        counts['unknown_values'] = counts.index.map(lambda r: ', '.join(map(repr, unknown_values.get(r, [])[:TOP_VALUES])))
+        rows.append(counts.reset_index())
+    return pd.concat(rows, ignore_index=True) if rows else pd.DataFrame()
+
+
+## 3. 좌표 점검
+def coordinate_profile(df):
+    lat_raw, lon_raw = df['latitude'], df['longitude']
+    lat = pd.to_numeric(lat_raw, errors='coerce')
+    lon = pd.to_numeric(lon_raw, errors='coerce')
+    missing = lat_raw.isna() | lon_raw.isna()
+    non_numeric = ~missing & (lat.isna() | lon.isna())
+    zero = (lat == 0) | (lon == 0)
+    in_korea = lat.between(*KOREA_LAT) & lon.between(*KOREA_LON)
+    swapped = ~in_korea & lon.between(*KOREA_LAT) & lat.between(*KOREA_LON)
+    out_of_range = lat.notna() & lon.notna() & ~in_korea & ~swapped & ~zero
+    region_box = pd.Series(classify_region_by_latlon(lat, lon), index=df.index)
+    outside_region = in_korea & (region_box != df['region'])
+
+    frame = pd.DataFrame({
+        'region': df['region'], 'n': 1, 'missing': missing, 'non_numeric': non_numeric, 'zero': zero,
+        'swapped': swapped, 'out_of_range': out_of_range, 'outside_region_box': outside_region
+    })
+    return frame.groupby('region', sort=False).sum().reset_index()
+
+
+## 4. 주소 점검
+def address_profile(df):
+    road = df['address_road'] if 'address_road' in df.columns else pd.Series(np.nan, index=df.index)
+    lot = df['address_lot'] if 'address_lot' in df.columns else pd.Series(np.nan, index=df.index)
+    has_road = road.notna() & (road.astype(str).str.strip() != '')
+    has_lot = lot.notna() & (lot.astype(str).str.strip() != '')
+
+    # 파이프라인과 같은 규칙으로 구 정보 부여 (서울·부산: 도로명 주소의 '구', 제주도: 도로명 주소)
+    district_found = assign_district(df)['district'].notna()
+
+    frame = pd.DataFrame({
+        'region': df['region'], 'n': 1,
+        'no_address': ~has_road & ~has_lot,
+        'lot_only': ~has_road & has_lot,
+        # 점수 계산 뒤 address_road 결측으로 제거되던 행
+        'dropped_without_road': ~has_road,
+        'district_unparsed': (has_road | has_lot) & ~district_found
+    })
+    return frame.groupby('region', sort=False).sum().reset_index()
+
+
+## 5. 중복 시설
+def duplicate_profile(df):
+    keys = facility_key(df)
+    dup_key = keys.duplicated(keep=False)
+    lat = pd.to_numeric(df['latitude'], errors='coerce').round(5)
+    lon = pd.to_numeric(df['longitude'], errors='coerce').round(5)
+    coords = pd.DataFrame({'lat': lat, 'lon': lon})
+    dup_coord = coords.notna().all(axis=1) & coords.duplicated(keep=False)
+    frame = pd.DataFrame({'region': df['region'], 'n': 1, 'duplicate_key': dup_key, 'duplicate_coordinates': dup_coord})
+    summary = frame.groupby('region', sort=False).sum().reset_index()
+    examples = df.loc[dup_key, [c for c in ['region', 'address_road', 'address_lot', '화장실명'] if c in df.columns]]
+    return summary, examples.head(20)
+
+
+## 전체 프로파일 (원본 파일(=지역)별)
+def profile(df):
+    duplicates, duplicate_examples = duplicate_profile(df)
+    return {
+        'columns': column_profile(df),
+        'flags': flag_profile(df),
+        'coordinates': coordinate_profile(df),
+        'addresses': address_profile(df),
+        'duplicates': duplicates,
+        'duplicate_examples': duplicate_examples
+    }
+
+
+def print_profile(result):
+    titles = {
+        'flags': '설치 여부 값 점검 (variant_yes: \'Y\'가 아닌 설치 값, 원본 분석에서 미설치로 처리됨)',
+        'coordinates': '좌표 점검',
+        'addresses': '주소 점검',
+        'duplicates': '중복 시설'
+    }
+    for key, title in titles.items():
+        print(f"{title}:")
+        print(result[key].to_string(index=False))
+        print()
+    columns = result['columns']
+    print("결측률 20% 이상 컬럼:")
+    print(columns[columns['null_rate'] >= 20][['region', 'column', 'null_rate', 'n_unique']].to_string(index=False))
@@ -0,0 +1,239 @@
+import datetime
+import html
+import os
+import string
+
+import pandas as pd
+
+# 보고서에 붙이는 차트 / 지도 파일 (report, map 서브커맨드 출력)
+CHART_FILES = {
+    'region_accessibility.png': '지역별 접근성 점수 비교',
+    'risk_ratio.png': '지역별 위험 화장실 비율',
+    'critical_counts.png': '지역별 최우선 개선 대상 지점 수'
+}
+MAP_FILES = {
+    'restroom_map_clean.html': '전체 공중화장실 지도',
+    'risk_restroom_map.html': '위험 지점 지도',
+    'critical_points_map.html': '최우선 개선 대상 지도'
+}
+
+MARKDOWN_TEMPLATE = """# 공중화장실 접근성·안전성 분석 보고서
+
+> 생성: $generated_at (분석 결과 기준 시각: $data_time)
+
+## ✅ 요약 정리
+- 분석 대상: 공중화장실 $n_restrooms곳
+- 데이터 오류: 주소와 좌표 불일치 $n_region_mismatch건 → 지도 왜곡 원인
+- 가장 위험한 지역: $worst_region (위험 비율 $worst_ratio, 평균 접근성 $worst_access, 안전성 $worst_safety)
+- 가장 안전한 구: $safest_district (접근성 $safest_access, 안전성 $safest_safety)
+
+- 접근성과 안전성이 모두 0점인 최우선 개선 대상 지점 수 (critical_points 기준):
+  → 전국 총 $n_critical개 지점
+  → $critical_by_region
+
+## 지역별 평균 점수
+$region_table
+
+## 지역별 위험 비율
+$risk_table
+
+## 접근성 점수 0인 지점의 안전성 점수 분포
+- 안전성 0점: $zero_safety_0개 지점 (접근성도 없고 안전성도 없음)
+- 안전성 1점: $zero_safety_1개 지점
+- 안전성 2점 이상: $zero_safety_2plus개 지점
+
+## 시설별 누락률
+- 기저귀교환대: $diaper_missing% 미설치 (설치 $diaper_installed%)
+- CCTV: $cctv_missing% 미설치 (설치 $cctv_installed%)
+- 비상벨: $bell_missing% 미설치 (설치 $bell_installed%)
+
+$coverage_table
+
+## 비상벨 설치 장소
+비상벨이 설치된 $n_bells개소 중 상위 설치 유형:
+
+$bell_table
+
+## 차트
+$charts
+
+## 지도
+$maps
+"""
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>공중화장실 접근성·안전성 분석 보고서</title>
+<style>
+body { font-family: 'Malgun Gothic', sans-serif; max-width: 960px; margin: 2em auto; line-height: 1.6; }
+table { border-collapse: collapse; margin: 1em 0; }
+th, td { border: 1px solid #ccc; padding: 4px 10px; text-align: right; }
+img { max-width: 100%; }
+</style>
+</head>
+<body>
+<h1>공중화장실 접근성·안전성 분석 보고서</h1>
+<p>생성: $generated_at (분석 결과 기준 시각: $data_time)</p>
+
+<h2>✅ 요약 정리</h2>
+<ul>
+<li>분석 대상: 공중화장실 $n_restrooms곳</li>
+<li>데이터 오류: 주소와 좌표 불일치 $n_region_mismatch건 → 지도 왜곡 원인</li>
+<li>가장 위험한 지역: $worst_region (위험 비율 $worst_ratio, 평균 접근성 $worst_access, 안전성 $worst_safety)</li>
+<li>가장 안전한 구: $safest_district (접근성 $safest_access, 안전성 $safest_safety)</li>
+<li>접근성과 안전성이 모두 0점인 최우선 개선 대상: 전국 총 $n_critical개 지점 ($critical_by_region)</li>
+</ul>
+
+<h2>지역별 평균 점수</h2>
+$region_table
+
+<h2>지역별 위험 비율</h2>
+$risk_table
+
+<h2>접근성 점수 0인 지점의 안전성 점수 분포</h2>
+<ul>
+<li>안전성 0점: $zero_safety_0개 지점</li>
+<li>안전성 1점: $zero_safety_1개 지점</li>
+<li>안전성 2점 이상: $zero_safety_2plus개 지점</li>
+</ul>
+
+<h2>시설별 누락률</h2>
+<ul>
+<li>기저귀교환대: $diaper_missing% 미설치 (설치 $diaper_installed%)</li>
+<li>CCTV: $cctv_missing% 미설치 (설치 $cctv_installed%)</li>
+<li>비상벨: $bell_missing% 미설치 (설치 $bell_installed%)</li>
+</ul>
+$coverage_table
+
+<h2>비상벨 설치 장소</h2>
+<p>비상벨이 설치된 $n_bells개소 중 상위 설치 유형:</p>
+$bell_table
+
+<h2>차트</h2>
+$charts
+
+<h2>지도</h2>
+$maps
+</body>
+</html>
+"""
+
+
+## 표 변환
+def markdown_table(df):
+    df = df.astype(object).where(df.notna(), '')
+    header = '| ' + ' | '.join(str(c) for c in df.columns) + ' |'
+    line = '|' + '|'.join(' --- ' for _ in df.columns) + '|'
+    rows = ['| ' + ' | '.join(str(v) for v in row) + ' |' for row in df.itertuples(index=False)]
+    return '\n'.join([header, line] + rows)
+
+
+def render_table(df, fmt):
+    if fmt == 'html':
+        return df.to_html(index=False, border=0)
+    return markdown_table(df)
+
+
+def fmt_number(value):
+    return f'{int(value):,}'
+
+
+## 집계 결과 -> 보고서 값
+def build_context(summaries, fmt='md', asset_dir='.', data_time=None):
+    region_summary = summaries['region_summary']
+    risk_ratio = summaries['risk_ratio']
+    risk_summary = summaries['risk_summary']
+    critical_points = summaries['critical_points']
+    district_summary = summaries['district_summary']
+
+    context = {
+        'generated_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'data_time': data_time or '-',
+        'n_restrooms': fmt_number(summaries.get('n_restrooms', 0)),
+        'n_region_mismatch': fmt_number(summaries.get('n_region_mismatch', 0)),
+        'region_table': render_table(region_summary.reset_index(), fmt),
+        'risk_table': render_table(risk_ratio.rename('risk_ratio').reset_index(), fmt)
+    }
+
+    # 가장 위험한 지역 (위험 비율 최대)
+    worst = risk_ratio.idxmax() if len(risk_ratio) else None
+    context['worst_region'] = worst or '-'
+    context['worst_ratio'] = f'{risk_ratio[worst]:.2f}' if worst else '-'
+    context['worst_access'] = f"{region_summary.loc[worst, 'accessibility_score']:.1f}" if worst in region_summary.index else '-'
+    context['worst_safety'] = f"{region_summary.loc[worst, 'safety_score']:.1f}" if worst in region_summary.index else '-'
+
+    # 가장 안전한 구 (서울·부산, 안전성 -> 접근성 순)
+    city = district_summary[district_summary['region'].isin(['서울', '부산']) & district_summary['district'].notna()]
+    if len(city):
+        best = city.sort_values(['safety_score', 'accessibility_score'], ascending=False).iloc[0]
+        context['safest_district'] = f"{best['region']} {best['district']}"
+        context['safest_access'] = f"{best['accessibility_score']:.1f}"
+        context['safest_safety'] = f"{best['safety_score']:.1f}"
+    else:
+        context['safest_district'] = context['safest_access'] = context['safest_safety'] = '-'
+
+    # 최우선 개선 대상
+    region_counts = critical_points['region'].value_counts()
+    context['n_critical'] = fmt_number(len(critical_points))
+    context['critical_by_region'] = ' / '.join(f'{r}: {fmt_number(c)}곳' for r, c in region_counts.items()) or '-'
+    if '제주도' in risk_summary.index:
+        context['critical_by_region'] += f" (제주도 위험 지점 평균 접근성 {risk_summary.loc['제주도', 'accessibility_score']:.2f})"
+
+    # 접근성 0인 지점의 안전성 분포
+    zero = summaries.get('zero_access_safety')
+    safety_cols = [c for c in (zero.columns if zero is not None else []) if c.startswith('safety_')]
+    zero_counts = zero[safety_cols].iloc[0] if zero is not None and len(zero) else pd.Series(dtype=int)
+    context['zero_safety_0'] = fmt_number(zero_counts.get('safety_0', 0))
+    context['zero_safety_1'] = fmt_number(zero_counts.get('safety_1', 0))
+    context['zero_safety_2plus'] = fmt_number(zero_counts[[c for c in safety_cols if int(c.split('_')[1]) >= 2]].sum())
+
+    # 시설별 설치율 / 미설치율
+    coverage = summaries.get('facility_coverage')
+    facility_keys = {'기저귀교환대': 'diaper', 'CCTV': 'cctv', '비상벨': 'bell'}
+    for facility, key in facility_keys.items():
+        row = coverage[coverage['facility'] == facility] if coverage is not None else []
+        context[f'{key}_missing'] = f"{row['missing_rate'].iat[0]:.1f}" if len(row) else '-'
+        context[f'{key}_installed'] = f"{row['installed_rate'].iat[0]:.1f}" if len(row) else '-'
+    region_coverage = summaries.get('region_coverage')
+    context['coverage_table'] = render_table(
+        region_coverage[['region', 'facility', 'installed', 'not_installed', 'installed_rate', 'missing_rate']], fmt
+    ) if region_coverage is not None else ''
+
+    # 비상벨 설치 장소
+    bells = summaries.get('bell_locations')
+    context['n_bells'] = fmt_number(bells['count'].sum()) if bells is not None else '0'
+    context['bell_table'] = render_table(bells.head(10), fmt) if bells is not None else ''
+
+    # 차트 / 지도 (마지막 실행에서 만들어진 파일만)
+    charts = [(f, title) for f, title in CHART_FILES.items() if os.path.exists(os.path.join(asset_dir, f))]
+    maps = [(f, title) for f, title in MAP_FILES.items() if os.path.exists(os.path.join(asset_dir, f))]
+    if fmt == 'html':
+        context['charts'] = '\n'.join(f'<figure><img src="{html.escape(f)}" alt="{title}"><figcaption>{title}</figcaption></figure>'
+                                      for f, title in charts) or '<p>차트 없음</p>'
+        context['maps'] = '<ul>\n' + '\n'.join(f'<li><a href="{html.escape(f)}">{title}</a></li>' for f, title in maps) + '\n</ul>' \
+            if maps else '<p>지도 없음</p>'
+    else:
+        context['charts'] = '\n\n'.join(f'![{title}]({f})' for f, title in charts) or '차트 없음'
+        context['maps'] = '\n'.join(f'- [{title}]({f})' for f, title in maps) or '지도 없음'
+    return context
+
+
+## 보고서 생성 (원본 데이터 없이 저장된 집계만 사용)
+def build_report(summary_path, out_path, fmt='md', asset_dir=None, template_path=None):
+    summaries = pd.read_pickle(summary_path)
+    asset_dir = asset_dir or os.path.dirname(os.path.abspath(out_path))
+    data_time = datetime.datetime.fromtimestamp(os.path.getmtime(summary_path)).strftime('%Y-%m-%d %H:%M')
+
+    if template_path:
+        with open(template_path, encoding='utf-8') as f:
+            template = f.read()
+    else:
+        template = HTML_TEMPLATE if fmt == 'html' else MARKDOWN_TEMPLATE
+
+    context = build_context(summaries, fmt=fmt, asset_dir=asset_dir, data_time=data_time)
+    text = string.Template(template).safe_substitute(context)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return out_path
@@ -0,0 +1,454 @@
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+# 서브커맨드별로 불러오는 모듈 (pandas, folium, matplotlib 등 무거운 의존성은 이 모듈들 안에서만 import)
+SUBCOMMAND_MODULES = {
+    'ingest': ['pipeline', 'profiling'],
+    'geocode': ['pipeline', 'geocoder'],
+    'score': ['pipeline', 'admin_boundaries'],
+    'map': ['pipeline', 'maps'],
+    'report': ['pipeline', 'charts'],
+    'coverage': ['pipeline', 'facility_stats'],
+    'patterns': ['pipeline', 'patterns'],
+    'hotspot': ['pipeline', 'hotspot'],
+    'snapshot': ['pipeline', 'snapshot_store'],
+    'route': ['pipeline', 'routing'],
+    'index': ['pipeline', 'composite_index'],
+    'stats': ['pipeline', 'bootstrap_stats'],
+    'build-report': ['pipeline', 'report_builder'],
+    'profile': ['pipeline', 'profiling'],
+    'admin': ['pipeline', 'admin_boundaries'],
+    'golden': ['golden']
+}
+
+# 서브커맨드별 시작 시간 예산 (초, 인터프리터 기동 + 모듈 import)
+STARTUP_BUDGET = {
+    'ingest': 1.5,
+    'geocode': 1.5,
+    'score': 1.5,
+    'map': 2.5,
+    'report': 3.0,
+    'coverage': 1.5,
+    'patterns': 1.5,
+    'hotspot': 3.0,
+    'snapshot': 2.0,
+    'route': 2.0,
+    'index': 1.5,
+    'stats': 1.5,
+    'build-report': 1.0,
+    'profile': 1.5,
+    'admin': 1.5,
+    'golden': 3.0
+}
+
+
+def load_modules(command):
+    return [importlib.import_module(name) for name in SUBCOMMAND_MODULES[command]]
+
+
+## 서브커맨드
+def cmd_ingest(args):
+    pipeline, profiling = load_modules('ingest')
+    df = pipeline.load_raw(args.data_path)
+    pipeline.save_stage(df, args.workdir, 'ingest')
+    print(f"ingest: {len(df)}건 -> {pipeline.stage_path(args.workdir, 'ingest')}")
+
+    # 원본 데이터 품질 점검 (매 ingest마다)
+    if not args.no_profile:
+        result = profiling.profile(df)
+        pipeline.save_stage(result, args.workdir, 'profile')
+        profiling.print_profile(result)
+
+
+def cmd_geocode(args):
+    pipeline, geocoder = load_modules('geocode')
+    df = pipeline.load_stage(args.workdir, 'ingest')
+    df = geocoder.geocode(df, cache_path=args.cache, legacy_cache_path=args.legacy_cache, offline=args.offline)
+    pipeline.save_stage(df, args.workdir, 'geocode')
+    print(f"geocode: 좌표 {df['latitude'].notna().sum()}/{len(df)}건 -> {pipeline.stage_path(args.workdir, 'geocode')}")
+    print(df.groupby('region')['geocode_match'].value_counts().unstack(fill_value=0))
+
+
+def cmd_score(args):
+    pipeline, admin_boundaries = load_modules('score')
+    # 좌표 변환 결과가 없으면 원본 좌표로 점수만 계산
+    try:
+        df = pipeline.load_stage(args.workdir, 'geocode')
+    except FileNotFoundError:
+        df = pipeline.load_stage(args.workdir, 'ingest')
+    admin = None
+    if args.boundaries:
+        index = admin_boundaries.load_index(args.boundaries)
+        admin = admin_boundaries.admin_regions(df, index, cache_dir=os.path.join(args.workdir, 'admin'))
+    df, df_clean = pipeline.score(df, admin)
+    summaries = pipeline.summarize(df, df_clean)
+    pipeline.save_stage(df_clean, args.workdir, 'score')
+    pipeline.save_stage(summaries, args.workdir, 'summary')
+    print(summaries['region_summary'])
+    print(summaries['risk_ratio'])
+
+
+def cmd_map(args):
+    pipeline, maps = load_modules('map')
+    df_clean = pipeline.load_stage(args.workdir, 'score')
+    paths = maps.export_maps(df_clean, args.out, by_region=args.by_region, by_risk_type=args.by_risk_type,
+                             layered=args.layered, workers=args.workers, cache_dir=os.path.join(args.workdir, 'maps'))
+    for path in paths:
+        print(f"map: {path}")
+
+
+def cmd_report(args):
+    pipeline, charts = load_modules('report')
+    summaries = pipeline.load_stage(args.workdir, 'summary')
+    print("지역별 평균 점수:")
+    print(summaries['region_summary'])
+    print("\n지역별 위험 비율:")
+    print(summaries['risk_ratio'])
+    print("\n지역별 최우선 개선 대상 지점 수:")
+    print(summaries['critical_points']['region'].value_counts())
+    for path in charts.save_charts(summaries, args.out):
+        print(f"chart: {path}")
+
+
+def cmd_coverage(args):
+    pipeline, facility_stats = load_modules('coverage')
+    df = pipeline.assign_district(pipeline.load_stage(args.workdir, 'ingest'))
+    by = {'national': None, 'region': 'region', 'district': ['region', 'district']}[args.by]
+    # 기본은 점수·보고서와 같은 판정 ('Y'만 설치), --lenient면 'y', '1', '있음' 등도 설치로
+    if args.lenient:
+        print("설치 판정: 완화 ('Y' 외에 'y', '1', '있음' 등도 설치로 집계, 점수·보고서와 다를 수 있음)\n")
+    else:
+        df = pipeline.score_flags(df)
+        print("설치 판정: 점수와 같은 기준 ('Y'만 설치)\n")
+    print("시설별 설치율 / 미설치율:")
+    print(facility_stats.facility_coverage(df, by=by).to_string(index=False))
+    print("\n비상벨 설치 장소:")
+    print(facility_stats.location_breakdown(df, by=by).to_string(index=False))
+    print("\n비상벨 공간별 설치 공백 (비상벨은 있지만 해당 공간에는 없음):")
+    print(facility_stats.bell_coverage(df, by=by).to_string(index=False))
+
+
+def cmd_patterns(args):
+    pipeline, patterns = load_modules('patterns')
+    df = pipeline.assign_district(pipeline.load_stage(args.workdir, 'ingest'))
+    by = ['region', 'district'] if args.by == 'district' else ['region']
+
+    table = patterns.combination_table(df, by=by, min_count=args.min_count)
+    print("과대 / 과소 대표 시설 조합:")
+    print(table[table['pattern'] != ''].sort_values('z', key=abs, ascending=False).to_string(index=False))
+
+    deficiency = patterns.conditional_deficiency(df, by=by)
+    print("\n조건부 결핍률 (given_missing이 없을 때 missing도 없을 비율):")
+    print(deficiency[deficiency['ratio'] >= args.min_ratio].sort_values('ratio', ascending=False).to_string(index=False))
+
+    print("\n접근성 0인 지점의 안전성 점수 분포:")
+    print(patterns.safety_given_zero_access(pipeline.compute_scores(df), by=['region']).to_string(index=False))
+
+
+def cmd_hotspot(args):
+    pipeline, hotspot = load_modules('hotspot')
+    df_clean = pipeline.load_stage(args.workdir, 'score')
+    summaries = pipeline.load_stage(args.workdir, 'summary')
+    target = summaries['critical_points'] if args.target == 'critical' else summaries['risk_df']
+
+    points, summary, gi = hotspot.detect_hotspots(
+        df_clean, target, eps_m=args.eps, min_samples=args.min_samples, bandwidth_m=args.bandwidth
+    )
+    path = os.path.join(args.out, f'hotspots_{args.target}.geojson')
+    hotspot.save_geojson(summary, path)
+    print(f"{args.target} 핫스팟 순위:")
+    print(summary.drop(columns='polygon').to_string(index=False))
+    print("\nGi* 분류:")
+    print(gi.loc[gi['is_target'] == 1, 'gi_class'].value_counts())
+    print(f"\ngeojson: {path}")
+
+
+def cmd_snapshot(args):
+    pipeline, snapshot_store = load_modules('snapshot')
+    if args.action == 'save':
+        df_clean = pipeline.load_stage(args.workdir, 'score')
+        snapshot_date, n_written, n_repeated = snapshot_store.write_snapshot(df_clean, args.store, args.date)
+        print(f"snapshot: {snapshot_date} ({n_written}건) -> {args.store}")
+        if n_repeated:
+            print(f"주의: 지역·주소·이름이 같은 시설 {n_repeated}곳은 키에 순번을 붙여 저장했습니다")
+    elif args.action == 'list':
+        print('\n'.join(snapshot_store.list_snapshots(args.store)))
+    elif args.action == 'trend':
+        print("지역별 위험 비율 추이:")
+        print(snapshot_store.region_risk_trend(args.store, args.start, args.end, args.region))
+        print("\n구별 점수 추이:")
+        print(snapshot_store.district_trends(args.store, args.start, args.end, args.region).to_string(index=False))
+    else:
+        snapshots = snapshot_store.list_snapshots(args.store)
+        before = args.before or (snapshots[-2] if len(snapshots) >= 2 else None)
+        after = args.after or (snapshots[-1] if snapshots else None)
+        if before is None or after is None:
+            raise SystemExit("비교할 스냅샷이 두 개 이상 필요합니다")
+        changed, added, removed = snapshot_store.facility_changes(args.store, before, after)
+        print(f"{before} -> {after}: 상향 {(changed['change'] == '상향').sum()}곳, "
+              f"하향 {(changed['change'] == '하향').sum()}곳, 혼합 {(changed['change'] == '혼합').sum()}곳, "
+              f"신규 {len(added)}곳, 제외 {len(removed)}곳")
+        for axis, name in [('accessibility', '접근성'), ('safety', '안전성')]:
+            direction = changed[f'{axis}_direction']
+            print(f"  {name}: 상향 {(direction == '상향').sum()}곳, 하향 {(direction == '하향').sum()}곳")
+        print(changed.to_string(index=False))
+        print("\n새로 최우선 개선 대상이 된 지점:")
+        print(snapshot_store.new_critical_points(args.store, before, after).to_string(index=False))
+
+
+def cmd_route(args):
+    pipeline, routing = load_modules('route')
+    df_clean = pipeline.load_stage(args.workdir, 'score')
+    if args.region:
+        df_clean = df_clean[df_clean['region'] == args.region]
+
+    graph = routing.load_graph(args.graph)
+    facilities = df_clean[df_clean['accessibility_score'] >= args.min_access]
+    node_dist = routing.nearest_facility_distance(graph, facilities)
+    summary, per_restroom = routing.district_access(graph, node_dist, df_clean, within_m=args.within)
+    print(f"그래프 노드 {graph.adjacency.shape[0]}개, 간선 {graph.adjacency.nnz}개, 기준 시설 {len(facilities)}곳")
+    print(f"구별 보행 거리 (접근성 {args.min_access}점 이상 시설까지, within_share = {args.within:.0f}m 이내 비율 %):")
+    print(summary.to_string(index=False))
+    if args.save:
+        pipeline.save_stage(per_restroom, args.workdir, 'route')
+        print(f"\nroute: {pipeline.stage_path(args.workdir, 'route')}")
+
+
+def cmd_index(args):
+    pipeline, composite_index = load_modules('index')
+    df_clean = pipeline.load_stage(args.workdir, 'score')
+    schemes = composite_index.load_schemes(args.schemes) if args.schemes else composite_index.DEFAULT_SCHEMES
+
+    scores = composite_index.composite_scores(df_clean, schemes, method=args.method, cap=args.cap)
+    rankings = composite_index.district_rankings(df_clean, scores, min_count=args.min_count)
+    print(f"구별 복합 지표 ({args.method}, 장애인화장실 최대 {args.cap}개 반영):")
+    print(rankings.to_string(index=False))
+    n_unknown = int(df_clean['district'].isna().sum())
+    if n_unknown:
+        print(f"구 정보가 없는 화장실 {n_unknown}곳은 순위에서 제외했습니다")
+    print("\n가중치 방식 간 순위 상관 (Spearman):")
+    print(composite_index.ranking_comparison(rankings, schemes))
+
+
+def cmd_stats(args):
+    pipeline, bootstrap_stats = load_modules('stats')
+    df_clean = pipeline.load_stage(args.workdir, 'score')
+    stats = bootstrap_stats.district_statistics(
+        df_clean, n_boot=args.n_boot, ci=args.ci, seed=args.seed, cache_dir=os.path.join(args.workdir, 'stats')
+    )
+    for score in bootstrap_stats.SCORE_COLUMNS:
+        print(f"{score} 구별 평균 · {args.ci:.0%} 신뢰구간 · 축소 평균 (신뢰구간 하한 순):")
+        print(bootstrap_stats.confident_ranking(stats, score, min_count=args.min_count).to_string(index=False))
+        print()
+    unknown = stats[(stats['district'] == bootstrap_stats.UNKNOWN_GROUP) & (stats['score'] == stats['score'].iloc[0])]
+    if len(unknown):
+        print("구 정보가 없는 화장실 (순위 제외):")
+        print(unknown[['region', 'n']].to_string(index=False))
+
+
+def cmd_build_report(args):
+    pipeline, report_builder = load_modules('build-report')
+    out_path = args.output or os.path.join(args.out, f'report.{args.format}')
+    summary_path = pipeline.stage_path(args.workdir, 'summary')
+    if not os.path.exists(summary_path):
+        raise SystemExit(f"집계 결과가 없습니다: {summary_path} (score 단계를 먼저 실행하세요)")
+    report_builder.build_report(summary_path, out_path, fmt=args.format, asset_dir=args.out, template_path=args.template)
+    print(f"report: {out_path}")
+
+
+def cmd_profile(args):
+    pipeline, profiling = load_modules('profile')
+    result = profiling.profile(pipeline.load_stage(args.workdir, 'ingest'))
+    pipeline.save_stage(result, args.workdir, 'profile')
+    profiling.print_profile(result)
+    if args.columns:
+        print("\n컬럼별 값 범위:")
+        print(result['columns'].to_string(index=False))
+    if len(result['duplicate_examples']):
+        print("\n중복 시설 예시:")
+        print(result['duplicate_examples'].to_string(index=False))
+
+
+def cmd_admin(args):
+    pipeline, admin_boundaries = load_modules('admin')
+    try:
+        df = pipeline.load_stage(args.workdir, 'geocode')
+    except FileNotFoundError:
+        df = pipeline.load_stage(args.workdir, 'ingest')
+    index = admin_boundaries.load_index(args.boundaries)
+    admin = admin_boundaries.admin_regions(df, index, cache_dir=os.path.join(args.workdir, 'admin'))
+    print("주소 기반 구 정보 vs 좌표 기반 시/군/구:")
+    print(admin_boundaries.compare_districts(pipeline.assign_district(df), admin))
+    print("\n시/군/구별 읍/면/동 수:")
+    print(admin.dropna(subset=['sigungu']).groupby(['sido', 'sigungu'])['eupmyeondong'].nunique().to_string())
+
+
+def cmd_golden(args):
+    golden, = load_modules('golden')
+    expected_dir = args.expected or golden.EXPECTED_DIR
+    if args.action == 'record':
+        for name in golden.record(expected_dir):
+            print(f"golden: {os.path.join(expected_dir, name + '.parquet')}")
+        return
+
+    diff = golden.check(expected_dir, rtol=args.rtol, atol=args.atol, actual_dir=args.actual)
+    if len(diff):
+        print("기준 결과와 다른 항목:")
+        print(diff.to_string(index=False))
+        raise SystemExit(1)
+    print(f"golden: 기준 결과와 일치 ({expected_dir})")
+
+
+# 서브커맨드별 시작 시간 측정 (새 인터프리터에서 import까지 걸린 시간)
+def measure_startup(command):
+    code = f"import restroom_cli; restroom_cli.load_modules({command!r})"
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return time.perf_counter() - start
+
+
+def cmd_startup(args):
+    unknown = [c for c in args.commands if c not in SUBCOMMAND_MODULES]
+    if unknown:
+        raise SystemExit(f"알 수 없는 서브커맨드: {', '.join(unknown)}")
+
+    over_budget = []
+    for command in args.commands or list(SUBCOMMAND_MODULES):
+        elapsed = measure_startup(command)
+        budget = STARTUP_BUDGET[command]
+        status = 'OK' if elapsed <= budget else '초과'
+        print(f"{command:8s} {elapsed:6.3f}s / 예산 {budget:.1f}s  {status}")
+        if elapsed > budget:
+            over_budget.append(command)
+    return 1 if over_budget else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='공중화장실 접근성·안전성 분석')
+    parser.add_argument('--workdir', default='restroom_cache', help='단계별 중간 결과 폴더')
+    parser.add_argument('--timing', action='store_true', help='서브커맨드 실행 시간 출력')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('ingest', help='원본 엑셀 파일 불러오기')
+    p.add_argument('--data-path', default='C:/Users/anton/restroom_data/')
+    p.add_argument('--no-profile', action='store_true', help='데이터 품질 점검 생략')
+    p.set_defaults(func=cmd_ingest)
+
+    p = sub.add_parser('geocode', help='주소 좌표 변환 (Kakao API, 후보 캐싱 + 지역 일치도 기반 선택)')
+    p.add_argument('--cache', default='geocode_candidates.pkl', help='주소별 상위 후보 캐시')
+    p.add_argument('--legacy-cache', default='address_cache.pkl', help='기존 주소 -> 좌표 캐시 (후보 캐시가 없을 때 사용)')
+    p.add_argument('--offline', action='store_true', help='API 조회 없이 캐시된 후보만으로 다시 선택')
+    p.set_defaults(func=cmd_geocode)
+
+    p = sub.add_parser('score', help='접근성·안전성 점수 및 요약 테이블 계산')
+    p.add_argument('--boundaries', help='행정경계 GeoJSON (있으면 좌표 기준으로 시/군/구, 읍/면/동 부여)')
+    p.set_defaults(func=cmd_score)
+
+    p = sub.add_parser('map', help='folium 지도 저장')
+    p.add_argument('--out', default='.')
+    p.add_argument('--by-region', action='store_true', help='지역별 지도 추가')
+    p.add_argument('--by-risk-type', action='store_true', help='위험 유형별 지도 추가')
+    p.add_argument('--layered', action='store_true', help='모든 지도를 레이어로 가진 파일 하나로 저장')
+    p.add_argument('--workers', type=int, default=None, help='지도 저장 프로세스 수 (기본: CPU 수)')
+    p.set_defaults(func=cmd_map)
+
+    p = sub.add_parser('report', help='요약 출력 및 차트 저장')
+    p.add_argument('--out', default='.')
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser('coverage', help='시설별 설치율·미설치율 및 설치 장소 분포')
+    p.add_argument('--by', choices=['national', 'region', 'district'], default='region')
+    p.add_argument('--lenient', action='store_true', help="'Y' 외의 설치 표기('y', '1', '있음' 등)도 설치로 집계")
+    p.set_defaults(func=cmd_coverage)
+
+    p = sub.add_parser('patterns', help='시설 조합 패턴 및 조건부 결핍률 분석')
+    p.add_argument('--by', choices=['region', 'district'], default='district')
+    p.add_argument('--min-count', type=int, default=5)
+    p.add_argument('--min-ratio', type=float, default=1.2)
+    p.set_defaults(func=cmd_patterns)
+
+    p = sub.add_parser('hotspot', help='위험 지점 밀집 구역 탐지 (DBSCAN + Gi*)')
+    p.add_argument('--target', choices=['critical', 'risky'], default='critical')
+    p.add_argument('--eps', type=float, default=300, help='DBSCAN 반경 (m)')
+    p.add_argument('--min-samples', type=int, default=5)
+    p.add_argument('--bandwidth', type=float, default=500, help='Gi* 이웃 거리 (m)')
+    p.add_argument('--out', default='.')
+    p.set_defaults(func=cmd_hotspot)
+
+    p = sub.add_parser('snapshot', help='점수 테이블 스냅샷 저장 및 추이 분석')
+    p.add_argument('action', choices=['save', 'list', 'trend', 'changes'])
+    p.add_argument('--store', default='restroom_snapshots', help='스냅샷 저장 폴더 (Parquet)')
+    p.add_argument('--date', help='저장할 스냅샷 날짜 (YYYY-MM-DD, 기본: 오늘)')
+    p.add_argument('--start')
+    p.add_argument('--end')
+    p.add_argument('--region')
+    p.add_argument('--before')
+    p.add_argument('--after')
+    p.set_defaults(func=cmd_snapshot)
+
+    p = sub.add_parser('route', help='도로망 기준 접근 가능한 화장실까지의 보행 거리')
+    p.add_argument('--graph', required=True, help='로컬 OSM 추출본 (.geojson 또는 .pbf)')
+    p.add_argument('--region', help='분석할 지역 (예: 부산, 제주도)')
+    p.add_argument('--min-access', type=float, default=1, help='기준 시설의 최소 접근성 점수')
+    p.add_argument('--within', type=float, default=500, help='도보권 기준 거리 (m)')
+    p.add_argument('--save', action='store_true', help='화장실별 보행 거리를 작업 폴더에 저장')
+    p.set_defaults(func=cmd_route)
+
+    p = sub.add_parser('index', help='정규화 복합 지표 및 가중치 방식별 구 순위 비교')
+    p.add_argument('--method', choices=['capped', 'percentile', 'zscore'], default='capped')
+    p.add_argument('--cap', type=int, default=2, help='장애인화장실 수 상한')
+    p.add_argument('--schemes', help='가중치 방식 JSON 파일 ({"이름": [w1, ..., w5]})')
+    p.add_argument('--min-count', type=int, default=3, help='순위에 포함할 구의 최소 화장실 수')
+    p.set_defaults(func=cmd_index)
+
+    p = sub.add_parser('stats', help='구별 평균의 부트스트랩 신뢰구간 및 베이즈 축소 평균')
+    p.add_argument('--n-boot', type=int, default=2000)
+    p.add_argument('--ci', type=float, default=0.95)
+    p.add_argument('--seed', type=int, default=0)
+    p.add_argument('--min-count', type=int, default=3, help='순위에 포함할 구의 최소 화장실 수')
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser('build-report', help='저장된 집계·차트·지도로 보고서 생성 (원본 데이터 사용 안 함)')
+    p.add_argument('--format', choices=['md', 'html'], default='md')
+    p.add_argument('--out', default='.', help='차트·지도 파일이 있는 폴더 (보고서도 여기에 저장)')
+    p.add_argument('--output', help='보고서 파일 경로 (기본: <out>/report.<format>)')
+    p.add_argument('--template', help='사용자 템플릿 파일 ($변수 형식)')
+    p.set_defaults(func=cmd_build_report)
+
+    p = sub.add_parser('profile', help='원본 데이터 품질 점검 (값 범위, 결측률, 좌표·주소 오류, 중복)')
+    p.add_argument('--columns', action='store_true', help='컬럼별 값 범위 전체 출력')
+    p.set_defaults(func=cmd_profile)
+
+    p = sub.add_parser('admin', help='행정경계 공간 조인으로 시/도, 시/군/구, 읍/면/동 부여 결과 점검')
+    p.add_argument('--boundaries', required=True, help='행정경계 GeoJSON')
+    p.set_defaults(func=cmd_admin)
+
+    p = sub.add_parser('golden', help='고정 데이터로 파이프라인 실행 후 기준 결과 기록 / 비교')
+    p.add_argument('action', choices=['record', 'check'])
+    p.add_argument('--expected', help='기준 결과 폴더 (기본: golden/expected)')
+    p.add_argument('--actual', help='현재 결과를 남길 폴더 (check, 기본: 임시 폴더)')
+    p.add_argument('--rtol', type=float, default=1e-9)
+    p.add_argument('--atol', type=float, default=1e-9)
+    p.set_defaults(func=cmd_golden)
+
+    p = sub.add_parser('startup', help='서브커맨드별 시작 시간 측정 및 예산 확인')
+    p.add_argument('commands', nargs='*', metavar='command', help=f"측정할 서브커맨드 (기본: 전체, {', '.join(SUBCOMMAND_MODULES)})")
+    p.set_defaults(func=cmd_startup)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    start = time.perf_counter()
+    code = args.func(args)
+    if args.timing:
+        print(f"[{args.command}] {time.perf_counter() - start:.3f}s", file=sys.stderr)
+    return code or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
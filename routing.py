@@ -0,0 +1,176 @@
+import collections
+import json
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_M = 6371008.8
+
+# 보행 불가 도로 유형
+EXCLUDED_HIGHWAYS = {'motorway', 'motorway_link', 'trunk', 'trunk_link', 'construction', 'proposed', 'raceway', 'bus_guideway'}
+
+# 노드 좌표(위도/경도 배열)와 CSR 인접 행렬 (가중치 = 미터)
+RoadGraph = collections.namedtuple('RoadGraph', ['lat', 'lon', 'adjacency'])
+
+
+def is_walkable(tags):
+    highway = tags.get('highway')
+    if not highway or highway in EXCLUDED_HIGHWAYS:
+        return False
+    return tags.get('foot') != 'no' and tags.get('access') not in ('private', 'no')
+
+
+## 1. 로컬 OSM 추출본 읽기 (네트워크 사용 없음)
+# GeoJSON: LineString / MultiLineString 피처, properties에 highway 태그
+def read_geojson_ways(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    for feature in data.get('features', []):
+        geometry = feature.get('geometry') or {}
+        tags = feature.get('properties') or {}
+        if not is_walkable(tags):
+            continue
+        if geometry.get('type') == 'LineString':
+            yield geometry['coordinates']
+        elif geometry.get('type') == 'MultiLineString':
+            yield from geometry['coordinates']
+
+
+# PBF: pyosmium이 설치된 경우에만 지원
+def read_pbf_ways(path):
+    try:
+        import osmium
+    except ImportError:
+        raise ImportError("PBF 파일을 읽으려면 pyosmium이 필요합니다 (pip install osmium) - GeoJSON 추출본을 사용할 수도 있습니다")
+
+    ways = []
+
+    class WayHandler(osmium.SimpleHandler):
+        def way(self, w):
+            if is_walkable({tag.k: tag.v for tag in w.tags}):
+                ways.append([(n.lon, n.lat) for n in w.nodes if n.location.valid()])
+
+    WayHandler().apply_file(path, locations=True)
+    return ways
+
+
+def haversine_m(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+## 2. CSR 그래프 생성
+def build_graph(ways):
+    starts, ends = [], []
+    for coords in ways:
+        coords = np.asarray(coords, dtype=float)
+        if len(coords) < 2:
+            continue
+        starts.append(coords[:-1, :2])
+        ends.append(coords[1:, :2])
+    if not starts:
+        raise ValueError("보행 가능한 도로가 없습니다")
+    starts = np.concatenate(starts)
+    ends = np.concatenate(ends)
+
+    # 좌표를 1e-7도 단위 정수로 묶어서 노드 번호 부여 (공유 노드 병합)
+    points = np.concatenate([starts, ends])
+    fixed = np.round(points * 1e7).astype(np.int64)
+    keys = ((fixed[:, 0] + 2 ** 31).astype(np.uint64) << np.uint64(32)) | (fixed[:, 1] + 2 ** 31).astype(np.uint64)
+    unique_keys, first, node_ids = np.unique(keys, return_index=True, return_inverse=True)
+    lon, lat = points[first, 0], points[first, 1]
+
+    u, v = node_ids[:len(starts)], node_ids[len(starts):]
+    w = haversine_m(lat[u], lon[u], lat[v], lon[v])
+    keep = u != v
+
+    # 보행은 양방향, 중복 간선은 가장 짧은 것만 유지 (csr_matrix는 중복을 더하므로 미리 제거)
+    src = np.concatenate([u[keep], v[keep]])
+    dst = np.concatenate([v[keep], u[keep]])
+    weight = np.concatenate([w[keep], w[keep]])
+    order = np.lexsort((weight, dst, src))
+    src, dst, weight = src[order], dst[order], weight[order]
+    first_edge = np.ones(len(src), dtype=bool)
+    first_edge[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+    src, dst, weight = src[first_edge], dst[first_edge], np.maximum(weight[first_edge], 1e-3)
+
+    n = len(unique_keys)
+    adjacency = csr_matrix((weight, (src, dst)), shape=(n, n))
+    return RoadGraph(lat=lat, lon=lon, adjacency=adjacency)
+
+
+def load_graph(path):
+    if path.lower().endswith('.pbf'):
+        return build_graph(read_pbf_ways(path))
+    return build_graph(read_geojson_ways(path))
+
+
+## 3. 지점을 가장 가까운 그래프 노드에 연결 (위경도를 지역 평면 좌표(m)로 근사)
+def project(lat, lon, lat0):
+    x = np.radians(lon) * EARTH_RADIUS_M * np.cos(np.radians(lat0))
+    y = np.radians(lat) * EARTH_RADIUS_M
+    return np.column_stack([x, y])
+
+
+def snap_to_graph(graph, lat, lon):
+    lat0 = float(np.mean(graph.lat))
+    tree = cKDTree(project(graph.lat, graph.lon, lat0))
+    snap_m, node = tree.query(project(np.asarray(lat, dtype=float), np.asarray(lon, dtype=float), lat0))
+    return node, snap_m
+
+
+## 4. 다중 출발점 Dijkstra: 모든 노드의 가장 가까운 시설까지 보행 거리
+# 가상 출발 노드 하나에서 각 시설 노드로 (연결 거리) 간선을 이어 한 번에 계산
+def nearest_facility_distance(graph, facilities):
+    node, snap_m = snap_to_graph(graph, facilities['latitude'], facilities['longitude'])
+    n = graph.adjacency.shape[0]
+
+    source_weight = pd.Series(np.maximum(snap_m, 1e-3)).groupby(node).min()
+    adjacency = graph.adjacency.tocoo()
+    full = csr_matrix(
+        (np.concatenate([adjacency.data, source_weight.to_numpy()]),
+         (np.concatenate([adjacency.row, np.full(len(source_weight), n)]),
+          np.concatenate([adjacency.col, source_weight.index.to_numpy()]))),
+        shape=(n + 1, n + 1)
+    )
+    dist = dijkstra(full, directed=True, indices=n)
+    return dist[:n]
+
+
+## 5. 구별 집계
+# 노드는 가장 가까운 화장실의 구에 속한다고 보고 집계, 화장실별 보행 거리도 함께 계산
+def district_access(graph, node_dist, restrooms, max_snap_m=500, within_m=500):
+    restrooms = restrooms.dropna(subset=['latitude', 'longitude'])
+    lat0 = float(np.mean(graph.lat))
+    tree = cKDTree(project(restrooms['latitude'].to_numpy(), restrooms['longitude'].to_numpy(), lat0))
+    gap_m, nearest = tree.query(project(graph.lat, graph.lon, lat0))
+
+    nodes = pd.DataFrame({
+        'region': restrooms['region'].to_numpy()[nearest],
+        'district': restrooms['district'].to_numpy()[nearest],
+        'walk_m': node_dist
+    })[gap_m <= max_snap_m]
+    nodes['within'] = (nodes['walk_m'] <= within_m) * 100.0
+    # 도달 불가(inf) 노드는 거리 통계에서 빼고 unreachable로만 셈
+    nodes['reach_m'] = nodes['walk_m'].where(np.isfinite(nodes['walk_m']))
+
+    summary = (
+        nodes.groupby(['region', 'district'], dropna=False)
+        .agg(n_nodes=('walk_m', 'size'),
+             mean_walk_m=('reach_m', 'mean'),
+             median_walk_m=('reach_m', 'median'),
+             p90_walk_m=('reach_m', lambda s: s.quantile(0.9)),
+             unreachable=('walk_m', lambda s: (~np.isfinite(s)).sum()),
+             within_share=('within', 'mean'))
+        .round(1)
+        .reset_index()
+    )
+
+    node, snap_m = snap_to_graph(graph, restrooms['latitude'], restrooms['longitude'])
+    per_restroom = restrooms.copy()
+    per_restroom['walk_to_accessible_m'] = node_dist[node] + snap_m
+    return summary, per_restroom
@@ -0,0 +1,152 @@
+import datetime
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from pipeline import unique_facility_keys
+
+# 스냅샷에 저장하는 컬럼 (점수 테이블 기준)
+SNAPSHOT_COLUMNS = [
+    'facility_key', 'region', 'district', 'address_road', 'latitude', 'longitude',
+    'accessibility_score', 'safety_score', 'is_risky', 'risk_type', 'is_critical'
+]
+
+PARTITION = 'snapshot_date'
+
+
+def snapshot_table(df_clean):
+    table = df_clean.copy()
+    # 키는 불러오기 단계에서 매김 (키가 없는 이전 단계 결과만 여기서 계산)
+    if 'facility_key' not in table.columns:
+        table['facility_key'] = unique_facility_keys(table)
+    table['is_critical'] = (table['accessibility_score'] == 0) & (table['safety_score'] == 0)
+    for col in SNAPSHOT_COLUMNS:
+        if col not in table.columns:
+            table[col] = None
+    table = table[SNAPSHOT_COLUMNS]
+    table['district'] = table['district'].astype(object).where(table['district'].notna(), None).astype('string')
+    return table.reset_index(drop=True)
+
+
+## 스냅샷 저장 (snapshot_date=YYYY-MM-DD 파티션, 같은 날짜는 덮어씀)
+# 반환: (날짜, 저장한 행 수, 번호를 붙여 구분한 중복 시설 수)
+def write_snapshot(df_clean, root, snapshot_date=None):
+    snapshot_date = str(snapshot_date or datetime.date.today().isoformat())
+    datetime.date.fromisoformat(snapshot_date)  # 형식 확인
+
+    snapshot = snapshot_table(df_clean)
+    n_repeated = int(snapshot['facility_key'].str.contains('#', regex=False).sum())
+    table = pa.Table.from_pandas(snapshot, preserve_index=False)
+    table = table.append_column(PARTITION, pa.array([snapshot_date] * len(table), pa.string()))
+    ds.write_dataset(
+        table,
+        root,
+        format='parquet',
+        partitioning=ds.partitioning(pa.schema([(PARTITION, pa.string())]), flavor='hive'),
+        existing_data_behavior='delete_matching',
+        basename_template='part-{i}.parquet'
+    )
+    return snapshot_date, len(snapshot), n_repeated
+
+
+def list_snapshots(root):
+    if not os.path.isdir(root):
+        return []
+    prefix = PARTITION + '='
+    return sorted(name[len(prefix):] for name in os.listdir(root) if name.startswith(prefix))
+
+
+def dataset(root):
+    return ds.dataset(
+        root,
+        format='parquet',
+        partitioning=ds.partitioning(pa.schema([(PARTITION, pa.string())]), flavor='hive')
+    )
+
+
+## 스냅샷 읽기: 필요한 컬럼과 파티션만 읽음 (predicate pushdown)
+def read_snapshots(root, columns, start=None, end=None, dates=None, region=None):
+    expr = None
+
+    def add(condition):
+        nonlocal expr
+        expr = condition if expr is None else expr & condition
+
+    if start is not None:
+        add(ds.field(PARTITION) >= str(start))
+    if end is not None:
+        add(ds.field(PARTITION) <= str(end))
+    if dates is not None:
+        add(ds.field(PARTITION).isin([str(d) for d in dates]))
+    if region is not None:
+        add(ds.field('region') == region)
+
+    columns = list(dict.fromkeys([PARTITION] + list(columns)))
+    return dataset(root).to_table(columns=columns, filter=expr).to_pandas()
+
+
+## 구별 점수 추이
+def district_trends(root, start=None, end=None, region=None):
+    df = read_snapshots(
+        root, ['region', 'district', 'accessibility_score', 'safety_score', 'is_risky'],
+        start=start, end=end, region=region
+    )
+    trend = (
+        df.groupby([PARTITION, 'region', 'district'], dropna=False)
+        .agg(n=('is_risky', 'size'),
+             accessibility_score=('accessibility_score', 'mean'),
+             safety_score=('safety_score', 'mean'),
+             risk_ratio=('is_risky', 'mean'))
+        .round(3)
+        .reset_index()
+    )
+    return trend.sort_values(['region', 'district', PARTITION]).reset_index(drop=True)
+
+
+## 지역별 위험 비율 추이 (예: 부산 risk_ratio 개선 여부)
+def region_risk_trend(root, start=None, end=None, region=None):
+    df = read_snapshots(root, ['region', 'is_risky'], start=start, end=end, region=region)
+    trend = df.groupby(['region', PARTITION])['is_risky'].mean().round(3).unstack(PARTITION)
+    return trend
+
+
+# 두 스냅샷의 시설을 키로 맞춤 (두 파티션만 읽음)
+def compare_snapshots(root, before, after, columns):
+    df = read_snapshots(root, ['facility_key', 'region', 'district'] + columns, dates=[before, after])
+    old = df[df[PARTITION] == str(before)].drop(columns=PARTITION).set_index('facility_key')
+    new = df[df[PARTITION] == str(after)].drop(columns=PARTITION).set_index('facility_key')
+    merged = old.join(new, how='outer', lsuffix='_before', rsuffix='_after')
+    for col in ['region', 'district']:
+        merged[col] = merged[col + '_after'].combine_first(merged[col + '_before'])
+        merged = merged.drop(columns=[col + '_before', col + '_after'])
+    return merged
+
+
+## 점수가 오른 / 내린 시설
+def facility_changes(root, before, after):
+    merged = compare_snapshots(root, before, after, ['accessibility_score', 'safety_score', 'risk_type'])
+    both = merged.dropna(subset=['accessibility_score_before', 'accessibility_score_after']).copy()
+    both['accessibility_change'] = both['accessibility_score_after'] - both['accessibility_score_before']
+    both['safety_change'] = both['safety_score_after'] - both['safety_score_before']
+    # 점수 축마다 따로 판정 (한쪽이 오르고 다른 쪽이 내려도 가려지지 않도록)
+    for axis in ['accessibility', 'safety']:
+        delta = both[f'{axis}_change']
+        both[f'{axis}_direction'] = np.select([delta > 0, delta < 0], ['상향', '하향'], default='변동 없음')
+    up = (both['accessibility_change'] > 0) | (both['safety_change'] > 0)
+    down = (both['accessibility_change'] < 0) | (both['safety_change'] < 0)
+    both['change'] = np.select([up & down, up, down], ['혼합', '상향', '하향'], default='변동 없음')
+
+    added = merged.index[merged['accessibility_score_before'].isna()]
+    removed = merged.index[merged['accessibility_score_after'].isna()]
+    changed = both[both['change'] != '변동 없음'].reset_index()
+    return changed, list(added), list(removed)
+
+
+## 새로 최우선 개선 대상(critical)이 된 지점
+def new_critical_points(root, before, after):
+    merged = compare_snapshots(root, before, after, ['is_critical', 'address_road', 'latitude', 'longitude'])
+    was_critical = merged['is_critical_before'].fillna(False).astype(bool)
+    now_critical = merged['is_critical_after'].fillna(False).astype(bool)
+    return merged[now_critical & ~was_critical].reset_index()